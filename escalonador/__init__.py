@@ -0,0 +1,34 @@
+"""
+Escalonamento de jobs em servidores heterogêneos com algoritmo genético.
+
+Uso embutido:
+
+    from escalonador import ConfiguracaoAG, Escalonador
+    resultado = Escalonador(ConfiguracaoAG(num_geracoes=50)).executar(jobs, servidores)
+
+Linha de comando: python -m escalonador run|generate|benchmark|stream|convert
+Importar o pacote não carrega dados nem executa nada; os módulos de cada modo são importados sob demanda.
+"""
+from .configuracao import ConfiguracaoAG
+from .criterios_parada import CriterioParada
+from .dados import carregar_jobs, carregar_servidores
+from .execucao import Escalonador, Resultado
+from .instancia import Instancia
+from .instrumentacao import Instrumentacao
+
+# Nomes em inglês da API pública
+Scheduler = Escalonador
+GAConfig = ConfiguracaoAG
+
+__all__ = [
+    'ConfiguracaoAG',
+    'CriterioParada',
+    'Escalonador',
+    'GAConfig',
+    'Instancia',
+    'Instrumentacao',
+    'Resultado',
+    'Scheduler',
+    'carregar_jobs',
+    'carregar_servidores',
+]
@@ -0,0 +1,181 @@
+import argparse
+import sys
+
+# Comandos que já têm linha de comando própria: módulo e descrição
+COMANDOS_MODULOS = {
+    'benchmark': ('benchmark', "benchmark de escalabilidade do simulador e do fitness"),
+    'stream': ('streaming', "escalonamento online de jobs lidos de um arquivo JSONL"),
+    'convert': ('formato_colunar', "converte jobs.csv/servers.csv para o formato colunar (.npy)"),
+}
+
+# Configuração das ilhas na linha de comando: tamanho:taxa separados por vírgula
+def _configuracoes_ilhas(texto):
+    configuracoes = []
+    for item in texto.split(','):
+        try:
+            tamanho, taxa = item.split(':')
+            configuracoes.append({'tamanho_populacao': int(tamanho), 'taxa_mutacao': float(taxa)})
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"ilha inválida: {item!r} (use tamanho:taxa, por exemplo 30:0.1)")
+    return configuracoes
+
+# Execução do algoritmo genético
+def executar(argv):
+    from .configuracao import ConfiguracaoAG
+    from .execucao import Escalonador
+    from .ilhas import TOPOLOGIAS
+    from .sequenciamento import OBJETIVOS
+
+    parser = argparse.ArgumentParser(prog='escalonador run', description="Executa o algoritmo genético sobre os CSVs ou o formato colunar.")
+    parser.add_argument('--jobs', default='jobs.csv')
+    parser.add_argument('--servidores', default='servers.csv')
+    parser.add_argument('--colunar', default=None, metavar='DIR',
+                        help="instância no formato colunar (escalonador convert) no lugar de --jobs/--servidores")
+    parser.add_argument('--populacao', type=int, default=ConfiguracaoAG.tamanho_populacao)
+    parser.add_argument('--geracoes', type=int, default=ConfiguracaoAG.num_geracoes)
+    parser.add_argument('--taxa-mutacao', type=float, default=ConfiguracaoAG.taxa_mutacao)
+    parser.add_argument('--torneio', type=int, default=ConfiguracaoAG.tamanho_torneio)
+    parser.add_argument('--modo', choices=('lista', 'vetorizada', 'incremental', 'sequenciamento', 'multiobjetivo'), default='lista')
+    parser.add_argument('--processos', type=int, default=1, help="processos para o fitness (0 = todos os núcleos)")
+    parser.add_argument('--ilhas', type=int, default=1)
+    parser.add_argument('--config-ilhas', type=_configuracoes_ilhas, default=None,
+                        help="população e taxa de mutação de cada ilha, como 30:0.1,60:0.05 (define o número de ilhas)")
+    parser.add_argument('--topologia', choices=TOPOLOGIAS, default=ConfiguracaoAG.topologia_ilhas)
+    parser.add_argument('--intervalo-migracao', type=int, default=ConfiguracaoAG.intervalo_migracao)
+    parser.add_argument('--migrantes', type=int, default=ConfiguracaoAG.num_migrantes)
+    parser.add_argument('--recursos', action='store_true', help="simulação com núcleos, memória e banda")
+    parser.add_argument('--peso-utilizacao', type=float, default=ConfiguracaoAG.peso_utilizacao)
+    parser.add_argument('--objetivo-sequenciamento', choices=OBJETIVOS, default=ConfiguracaoAG.objetivo_sequenciamento)
+    parser.add_argument('--fracao-heuristica', type=float, default=0.0)
+    parser.add_argument('--heuristicas', type=lambda texto: tuple(texto.split(',')), default=None,
+                        help="heurísticas da semente, como lpt,eft (padrão: todas, sem min_min/max_min em instâncias grandes)")
+    parser.add_argument('--elites-busca-local', type=int, default=ConfiguracaoAG.num_elites_busca_local,
+                        help="melhores indivíduos refinados por busca local a cada geração (modo incremental)")
+    parser.add_argument('--cache-fitness', type=int, default=ConfiguracaoAG.tamanho_cache_fitness,
+                        help="indivíduos no cache de fitness (modo lista; 0 = sem cache)")
+    parser.add_argument('--prazo-s', type=float, default=None)
+    parser.add_argument('--geracoes-sem-melhora', type=int, default=None)
+    parser.add_argument('--fitness-alvo', type=float, default=None)
+    parser.add_argument('--diversidade-minima', type=float, default=None)
+    parser.add_argument('--semente', type=int, default=None)
+    parser.add_argument('--metricas', default=None, help="arquivo JSON lines com as estatísticas de cada geração")
+    parser.add_argument('--checkpoint', default=None, help="arquivo .npz em que o estado da execução é salvo")
+    parser.add_argument('--intervalo-checkpoint', type=int, default=None, help="gerações entre checkpoints")
+    parser.add_argument('--partir-de', default=None, help="checkpoint usado como população inicial (partida a quente)")
+    parser.add_argument('--retomar', action='store_true', help="retoma exatamente a execução salva em --partir-de")
+    parser.add_argument('--silencioso', action='store_true', help="não imprime cada geração")
+    args = parser.parse_args(argv)
+    if args.retomar and args.partir_de is None:
+        parser.error("--retomar precisa de --partir-de")
+
+    escalonador = Escalonador(
+        tamanho_populacao=args.populacao,
+        num_geracoes=args.geracoes,
+        taxa_mutacao=args.taxa_mutacao,
+        tamanho_torneio=args.torneio,
+        populacao_vetorizada=args.modo == 'vetorizada',
+        avaliacao_incremental=args.modo == 'incremental',
+        sequenciamento=args.modo == 'sequenciamento',
+        multiobjetivo=args.modo == 'multiobjetivo',
+        num_processos=args.processos or None,
+        num_ilhas=args.ilhas,
+        configuracoes_ilhas=args.config_ilhas,
+        intervalo_migracao=args.intervalo_migracao,
+        num_migrantes=args.migrantes,
+        topologia_ilhas=args.topologia,
+        simulacao_recursos=args.recursos,
+        peso_utilizacao=args.peso_utilizacao,
+        objetivo_sequenciamento=args.objetivo_sequenciamento,
+        fracao_heuristica=args.fracao_heuristica,
+        heuristicas=args.heuristicas,
+        num_elites_busca_local=args.elites_busca_local,
+        prazo_s=args.prazo_s,
+        geracoes_sem_melhora=args.geracoes_sem_melhora,
+        fitness_alvo=args.fitness_alvo,
+        diversidade_minima=args.diversidade_minima,
+        semente=args.semente,
+        tamanho_cache_fitness=args.cache_fitness,
+        # O modelo de ilhas não entrega estatísticas por geração
+        imprimir_geracoes=not args.silencioso and args.ilhas <= 1 and not args.config_ilhas,
+        arquivo_metricas=args.metricas,
+        arquivo_checkpoint=args.checkpoint,
+        intervalo_checkpoint=args.intervalo_checkpoint,
+        checkpoint_inicial=args.partir_de,
+        retomar=args.retomar,
+    )
+    try:
+        escalonador.configuracao.validar()
+    except ValueError as erro:
+        parser.error(str(erro))
+    if args.colunar is not None:
+        resultado = escalonador.executar_colunar(args.colunar)
+    else:
+        resultado = escalonador.executar_csv(args.jobs, args.servidores)
+
+    print(f"Melhor solução encontrada: {resultado.individuo}")
+    print(f"Tempo total de execução: {resultado.tempo_total} ms")
+    print(f"Tempo médio de espera: {resultado.tempo_espera_medio} ms")
+    print(f"Tempos de ociosidade dos servidores: {resultado.ociosidade_servidores}")
+    if escalonador.fronte_pareto is not None:
+        print(f"Fronte de Pareto ({len(escalonador.fronte_pareto)} soluções):")
+        print(f"  {'Tempo total (ms)':>18} {'Espera média (ms)':>18} {'Ociosidade total (ms)':>22}")
+        for solucao in escalonador.fronte_pareto:
+            ociosidade_total = sum(solucao.ociosidade_servidores.values())
+            print(f"  {solucao.tempo_total:>18.2f} {solucao.tempo_espera_medio:>18.2f} {ociosidade_total:>22.2f}")
+    estatisticas_ilhas = escalonador.estatisticas_ilhas
+    if estatisticas_ilhas is not None and not args.silencioso:
+        print(f"Ilhas: {len(estatisticas_ilhas.fitness_por_ilha)} ({estatisticas_ilhas.topologia}), "
+              f"melhor ilha = {estatisticas_ilhas.melhor_ilha}, "
+              f"Fitness = {estatisticas_ilhas.fitness_por_ilha[estatisticas_ilhas.melhor_ilha]}, "
+              f"{estatisticas_ilhas.geracoes_por_segundo:.1f} gerações/s")
+    cache = escalonador.cache
+    if cache is not None:
+        print(f"Cache de fitness: {cache.acertos} acertos, {cache.falhas} falhas ({cache.taxa_acerto:.1%})")
+    if escalonador.instrumentacao is not None:
+        resumo = escalonador.instrumentacao.resumo()
+        print("Tempo por fase: " + ", ".join(f"{fase} = {tempo:.3f} s" for fase, tempo in resumo['tempos_s'].items()))
+        print(f"Simulações: {resumo['simulacoes']}")
+
+# Geração de instâncias fictícias
+def gerar(argv):
+    from .generate_jobs import DISTRIBUICOES_TAMANHO, gerar_jobs_csv
+    from .generate_server import gerar_servers_csv
+
+    parser = argparse.ArgumentParser(prog='escalonador generate', description="Gera jobs.csv e servers.csv fictícios.")
+    parser.add_argument('--jobs', type=int, default=100, help="número de jobs")
+    parser.add_argument('--servidores', type=int, default=10, help="número de servidores")
+    parser.add_argument('--distribuicao', choices=DISTRIBUICOES_TAMANHO, default='uniforme')
+    parser.add_argument('--multicore', type=float, default=0.5, help="proporção de jobs com suporta_multicore")
+    parser.add_argument('--semente', type=int, default=None)
+    parser.add_argument('--arquivo-jobs', default='jobs.csv')
+    parser.add_argument('--arquivo-servidores', default='servers.csv')
+    args = parser.parse_args(argv)
+
+    gerar_jobs_csv(args.arquivo_jobs, args.jobs, args.distribuicao, args.multicore, args.semente)
+    gerar_servers_csv(args.arquivo_servidores, args.servidores, args.semente)
+
+COMANDOS = {
+    'run': (executar, "executa o algoritmo genético"),
+    'generate': (gerar, "gera jobs.csv e servers.csv fictícios"),
+}
+
+# Linha de comando: python -m escalonador <comando> [opções]
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    descricoes = {nome: descricao for nome, (_, descricao) in {**COMANDOS, **COMANDOS_MODULOS}.items()}
+    if not argv or argv[0] not in descricoes:
+        print("uso: python -m escalonador <comando> [opções]\n\ncomandos:")
+        for nome, descricao in descricoes.items():
+            print(f"  {nome:<10} {descricao}")
+        sys.exit(0 if argv and argv[0] in ('-h', '--help') else 2)
+
+    comando, argumentos = argv[0], argv[1:]
+    if comando in COMANDOS:
+        COMANDOS[comando][0](argumentos)
+    else:
+        import importlib
+        modulo = importlib.import_module(f'.{COMANDOS_MODULOS[comando][0]}', __package__)
+        modulo.main(argumentos)
+
+if __name__ == "__main__":
+    main()
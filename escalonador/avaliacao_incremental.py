@@ -0,0 +1,256 @@
+import itertools
+
+import numpy as np
+
+from .criterios_parada import AcompanhamentoGeracoes, ultimo_progresso
+from .heuristicas import busca_local, populacao_semeada
+from .instrumentacao import SEM_INSTRUMENTACAO
+from .populacao_vetorizada import selecao_torneio_vetorizada
+from .simulador import calcular_fitness
+
+# Fração de genes diferentes acima da qual o crossover monta o filho do zero em vez de aplicar o delta
+FRACAO_MAXIMA_DELTA = 0.25
+
+# Estado de um indivíduo com resultados parciais por servidor
+class EstadoIndividuo:
+    """
+    Guarda, junto com o cromossomo vetorizado (índice de servidor de cada job), o estado de
+    cada servidor: carga e contribuição para a soma dos tempos de espera.
+    Mover um job entre servidores atualiza as cargas em O(1) (ou, para vários jobs, com um
+    bincount), então o fitness após mutação custa O(genes alterados) mais o máximo das cargas.
+    A fila de um servidor (os seus jobs em ordem crescente, que é a ordem FIFO do indivíduo) não
+    é guardada: ela é lida do cromossomo quando necessária, e a soma das esperas de um servidor
+    só é recalculada quando ele foi alterado e o tempo de espera é pedido.
+    """
+
+    def __init__(self, cromossomo, instancia, cargas, soma_inicios, sujos):
+        self.cromossomo = cromossomo
+        self.instancia = instancia
+        self.cargas = cargas
+        self.soma_inicios = soma_inicios
+        self.sujos = sujos
+
+    @classmethod
+    def de_cromossomo(cls, cromossomo, instancia):
+        """
+        Monta o estado completo de um cromossomo, com custo O(jobs).
+        """
+        num_servidores = instancia.num_servidores
+        jobs_idx = np.arange(instancia.num_jobs)
+        servidores_idx = cromossomo.astype(np.intp)
+        cargas = np.bincount(
+            servidores_idx, weights=instancia.tempos[jobs_idx, servidores_idx], minlength=num_servidores
+        )
+        return cls(cromossomo.copy(), instancia, cargas, np.zeros(num_servidores), set(range(num_servidores)))
+
+    def copia(self):
+        return EstadoIndividuo(
+            self.cromossomo.copy(), self.instancia, self.cargas.copy(), self.soma_inicios.copy(), set(self.sujos),
+        )
+
+    def fila(self, servidor):
+        """
+        Jobs atribuídos ao servidor, em ordem crescente (ordem FIFO).
+        """
+        return np.flatnonzero(self.cromossomo == servidor)
+
+    def mover(self, job, novo_servidor):
+        """
+        Move um job para outro servidor, atualizando as cargas dos dois servidores envolvidos.
+        """
+        antigo_servidor = int(self.cromossomo[job])
+        if antigo_servidor == novo_servidor:
+            return
+        tempos = self.instancia.tempos
+        self.cargas[antigo_servidor] -= tempos[job, antigo_servidor]
+        self.cargas[novo_servidor] += tempos[job, novo_servidor]
+        self.cromossomo[job] = novo_servidor
+        self.sujos.add(antigo_servidor)
+        self.sujos.add(novo_servidor)
+
+    def mover_varios(self, jobs, novos_servidores):
+        """
+        Move vários jobs distintos de uma vez: as cargas são atualizadas com dois bincounts,
+        sem passar job a job pelo Python.
+        """
+        if len(jobs) == 0:
+            return
+        tempos = self.instancia.tempos
+        num_servidores = self.instancia.num_servidores
+        antigos = self.cromossomo[jobs].astype(np.intp)
+        novos = np.asarray(novos_servidores, dtype=np.intp)
+        self.cargas -= np.bincount(antigos, weights=tempos[jobs, antigos], minlength=num_servidores)
+        self.cargas += np.bincount(novos, weights=tempos[jobs, novos], minlength=num_servidores)
+        self.cromossomo[jobs] = novos
+        alterados = antigos != novos
+        self.sujos.update(np.unique(np.concatenate([antigos[alterados], novos[alterados]])).tolist())
+
+    def avaliar_movimento(self, job, novo_servidor):
+        """
+        Retorna o makespan que o indivíduo teria se o job fosse movido para novo_servidor,
+        sem alterar o estado.
+        """
+        antigo_servidor = int(self.cromossomo[job])
+        if antigo_servidor == novo_servidor:
+            return self.makespan
+        tempos = self.instancia.tempos
+        carga_antiga = self.cargas[antigo_servidor]
+        carga_nova = self.cargas[novo_servidor]
+        self.cargas[antigo_servidor] = carga_antiga - tempos[job, antigo_servidor]
+        self.cargas[novo_servidor] = carga_nova + tempos[job, novo_servidor]
+        makespan = self.makespan
+        self.cargas[antigo_servidor] = carga_antiga
+        self.cargas[novo_servidor] = carga_nova
+        return makespan
+
+    @property
+    def makespan(self):
+        return float(self.cargas.max())
+
+    @property
+    def fitness(self):
+        return calcular_fitness(self.makespan, self.instancia)
+
+    @property
+    def tempo_espera_medio(self):
+        """
+        Tempo médio de espera, recalculando apenas os servidores alterados desde a última consulta.
+        """
+        tempos = self.instancia.tempos
+        for servidor in self.sujos:
+            duracoes = tempos[self.fila(servidor), servidor]
+            # O início de cada job é a soma das durações dos jobs anteriores na fila
+            self.soma_inicios[servidor] = float((np.cumsum(duracoes) - duracoes).sum())
+        self.sujos.clear()
+        return float(self.soma_inicios.sum() / self.instancia.num_jobs)
+
+    @property
+    def ociosidade_servidores(self):
+        makespan = self.makespan
+        return dict(zip(self.instancia.ids_servidores.tolist(), (makespan - self.cargas).tolist()))
+
+# Mutação incremental
+def mutacao_incremental(estado, taxa_mutacao, rng):
+    """
+    Aplica mutação no próprio estado, movendo apenas os genes sorteados.
+    O número de genes mutados segue a mesma distribuição da mutação gene a gene.
+    """
+    num_jobs = len(estado.cromossomo)
+    num_mutacoes = rng.binomial(num_jobs, taxa_mutacao)
+    if num_mutacoes:
+        jobs = rng.choice(num_jobs, size=num_mutacoes, replace=False)
+        estado.mover_varios(jobs, rng.integers(0, estado.instancia.num_servidores, size=num_mutacoes))
+    return estado
+
+# Crossover incremental
+def _combinar(base, doador, fatia):
+    """
+    Cria um filho a partir do estado `base`, trazendo os genes de `doador` na fatia indicada.
+    Só os genes em que os dois pais diferem são movidos, com uma única atualização vetorizada das cargas.
+    """
+    diferentes = np.flatnonzero(base.cromossomo[fatia] != doador.cromossomo[fatia]) + (fatia.start or 0)
+    if len(diferentes) > len(base.cromossomo) * FRACAO_MAXIMA_DELTA:
+        # Com muitos genes diferentes, montar o filho do zero custa menos que aplicar o delta
+        cromossomo = base.cromossomo.copy()
+        cromossomo[fatia] = doador.cromossomo[fatia]
+        return EstadoIndividuo.de_cromossomo(cromossomo, base.instancia)
+    filho = base.copia()
+    filho.mover_varios(diferentes, doador.cromossomo[diferentes])
+    return filho
+
+def crossover_incremental(estado1, estado2, rng):
+    """
+    Crossover de um ponto que reaproveita os resultados parciais por servidor dos pais.
+    Cada filho parte do pai que contribui com o maior segmento e recebe apenas os genes
+    diferentes do segmento menor, então o custo é proporcional a esses genes.
+    """
+    num_jobs = len(estado1.cromossomo)
+    if num_jobs < 2:
+        return estado1.copia(), estado2.copia()
+
+    ponto_corte = int(rng.integers(1, num_jobs))
+    inicio, fim = slice(0, ponto_corte), slice(ponto_corte, num_jobs)
+    if ponto_corte <= num_jobs - ponto_corte:
+        # filho1 = pai1[:corte] + pai2[corte:], partindo de pai2
+        filho1 = _combinar(estado2, estado1, inicio)
+        filho2 = _combinar(estado1, estado2, inicio)
+    else:
+        filho1 = _combinar(estado1, estado2, fim)
+        filho2 = _combinar(estado2, estado1, fim)
+    return filho1, filho2
+
+# Algoritmo genético com avaliação incremental, geração a geração
+def iterar_algoritmo_genetico_incremental(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio,
+                                          semente=None, fracao_heuristica=0.0, num_elites_busca_local=0,
+                                          iteracoes_busca_local=50, criterio=None, instrumentacao=None, heuristicas=None):
+    """
+    Executa o algoritmo genético mantendo o estado por servidor de cada indivíduo, de modo que
+    filhos são avaliados pelo delta em relação aos pais em vez de serem simulados do zero.
+    Com fracao_heuristica > 0 parte da população inicial vem das heurísticas construtivas (heuristicas), e com
+    num_elites_busca_local > 0 os melhores indivíduos de cada geração passam por busca local
+    (algoritmo memético) e são mantidos na geração seguinte.
+    O melhor de cada Progresso é o EstadoIndividuo do melhor indivíduo encontrado. Na instrumentação,
+    a avaliação dos filhos acontece dentro do crossover e da mutação e é contada nessas fases.
+    """
+    instrumentacao = instrumentacao or SEM_INSTRUMENTACAO
+    acompanhamento = AcompanhamentoGeracoes(num_geracoes, criterio, instrumentacao, instancia.num_servidores)
+    rng = np.random.default_rng(semente)
+    with instrumentacao.fase('inicializacao'):
+        populacao = [
+            EstadoIndividuo.de_cromossomo(cromossomo, instancia)
+            for cromossomo in populacao_semeada(tamanho_populacao, instancia, rng, fracao_heuristica, heuristicas=heuristicas)
+        ]
+
+    for geracao in itertools.count():
+        # Avaliar a população
+        with instrumentacao.fase('fitness'):
+            fitness_populacao = np.array([estado.fitness for estado in populacao])
+        instrumentacao.contar('simulacoes', len(populacao))
+
+        # Busca local nos melhores indivíduos, que seguem para a próxima geração
+        elites = []
+        if num_elites_busca_local > 0:
+            with instrumentacao.fase('busca_local'):
+                for indice in np.argsort(-fitness_populacao, kind='stable')[:num_elites_busca_local].tolist():
+                    busca_local(populacao[indice], iteracoes_busca_local, rng=rng)
+                    fitness_populacao[indice] = populacao[indice].fitness
+                    elites.append(populacao[indice].copia())
+
+        # Encontrar o melhor indivíduo da geração atual
+        melhor_da_geracao = populacao[int(np.argmax(fitness_populacao))]
+        acompanhamento.atualizar_melhor(melhor_da_geracao.fitness, melhor_da_geracao.copia)
+        progresso = acompanhamento.concluir(
+            geracao, fitness_populacao, lambda: np.stack([estado.cromossomo for estado in populacao]),
+            lambda: (melhor_da_geracao.makespan, melhor_da_geracao.ociosidade_servidores,
+                     {'tempo_espera_medio': melhor_da_geracao.tempo_espera_medio}),
+        )
+        yield progresso
+        if progresso.motivo_parada is not None:
+            return
+
+        # Gerar a nova população
+        num_pares = (tamanho_populacao - len(elites) + 1) // 2
+        with instrumentacao.fase('selecao'):
+            pais1 = selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)
+            pais2 = selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)
+        nova_populacao = elites
+        for i, j in zip(pais1.tolist(), pais2.tolist()):
+            with instrumentacao.fase('crossover'):
+                filho1, filho2 = crossover_incremental(populacao[i], populacao[j], rng)
+            with instrumentacao.fase('mutacao'):
+                nova_populacao.append(mutacao_incremental(filho1, taxa_mutacao, rng))
+                nova_populacao.append(mutacao_incremental(filho2, taxa_mutacao, rng))
+        populacao = nova_populacao[:tamanho_populacao]
+
+# Algoritmo genético com avaliação incremental
+def algoritmo_genetico_incremental(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente=None,
+                                   fracao_heuristica=0.0, num_elites_busca_local=0, iteracoes_busca_local=50,
+                                   criterio=None, ao_gerar=None, instrumentacao=None, heuristicas=None):
+    """
+    Executa iterar_algoritmo_genetico_incremental até o fim (ver ultimo_progresso).
+    Retorna o estado do melhor indivíduo encontrado.
+    """
+    return ultimo_progresso(iterar_algoritmo_genetico_incremental(
+        instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente,
+        fracao_heuristica, num_elites_busca_local, iteracoes_busca_local, criterio, instrumentacao, heuristicas,
+    ), ao_gerar).melhor
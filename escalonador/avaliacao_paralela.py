@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .instancia import Instancia
+from .simulador import fitness
+
+# Instância do problema e função de fitness de cada processo do pool, definidas uma única vez na inicialização
+_instancia_worker = None
+_fitness_worker = fitness
+
+def _inicializa_worker(jobs, servidores, funcao_fitness):
+    """
+    Recebe jobs e servidores uma única vez, na criação do processo, e monta a instância local.
+    """
+    global _instancia_worker, _fitness_worker
+    _instancia_worker = Instancia(jobs, servidores)
+    _fitness_worker = funcao_fitness
+
+def _avaliar_bloco(bloco):
+    """
+    Avalia um bloco contíguo da população dentro de um processo do pool.
+    """
+    instancia = _instancia_worker
+    return _fitness_worker(bloco, instancia.jobs, instancia.servidores, instancia)
+
+# Avaliação do fitness distribuída entre processos
+class AvaliadorParalelo:
+    """
+    Distribui a avaliação do fitness da população entre os processos de um ProcessPoolExecutor.
+    Jobs e servidores são enviados a cada processo apenas na inicialização do pool; a cada geração
+    só os indivíduos trafegam. A população é dividida em blocos contíguos e os resultados são
+    remontados na ordem original, então o resultado é idêntico ao da avaliação serial.
+    funcao_fitness deve ser serializável (função de módulo ou functools.partial) e ter a
+    assinatura de simulador.fitness.
+    """
+
+    def __init__(self, jobs, servidores, num_processos=None, funcao_fitness=fitness, blocos_por_processo=4):
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.blocos_por_processo = blocos_por_processo
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_processos,
+            initializer=_inicializa_worker,
+            initargs=(jobs, servidores, funcao_fitness),
+        )
+
+    def fitness(self, populacao):
+        """
+        Calcula o fitness da população, na mesma ordem de fitness() serial.
+        """
+        num_blocos = self.num_processos * self.blocos_por_processo
+        tamanho_bloco = max(1, -(-len(populacao) // num_blocos))
+        blocos = [populacao[i:i + tamanho_bloco] for i in range(0, len(populacao), tamanho_bloco)]
+
+        fitness_populacao = []
+        for resultado in self.executor.map(_avaliar_bloco, blocos):
+            fitness_populacao.extend(resultado)
+        return fitness_populacao
+
+    def fechar(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
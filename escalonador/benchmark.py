@@ -0,0 +1,151 @@
+import argparse
+import itertools
+import json
+import platform
+import random
+import time
+
+import numpy as np
+
+from .generate_jobs import DISTRIBUICOES_TAMANHO, gerar_jobs
+from .generate_server import gerar_servidores
+from .instancia import Instancia
+from .populacao_lista import gerar_nova_populacao
+from .populacao_vetorizada import (
+    fitness_vetorizado,
+    gerar_nova_populacao_vetorizada,
+    inicializa_populacao_vetorizada,
+    para_individuo,
+)
+from .simulador import fitness, simula_exec
+
+# Grade padrão de instâncias
+NUM_JOBS = [100, 1000, 10000, 100000, 1000000]
+NUM_SERVIDORES = [10, 100, 1000, 10000]
+PROPORCOES_MULTICORE = [0.0, 0.5, 1.0]
+
+# Limites para não montar instâncias que não cabem na memória ou levam horas no caminho em listas
+LIMITE_ELEMENTOS_MATRIZ = 200_000_000   # jobs x servidores da matriz de tempos
+LIMITE_JOBS_SIMULACAO = 100_000         # simula_exec e fitness com indivíduos em lista de tuplas
+
+# Medição de tempo
+def cronometrar(funcao, repeticoes):
+    """
+    Executa a função `repeticoes` vezes e retorna o menor tempo, em segundos.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+# Instância sintética determinística
+def gerar_instancia(num_jobs, num_servidores, distribuicao, proporcao_multicore, semente):
+    """
+    Gera jobs e servidores sintéticos. A semente de cada instância depende apenas dos parâmetros
+    da grade, então execuções diferentes comparam implementações sobre as mesmas instâncias.
+    """
+    sequencia = np.random.SeedSequence([
+        semente, num_jobs, num_servidores, DISTRIBUICOES_TAMANHO.index(distribuicao), int(proporcao_multicore * 100)
+    ])
+    semente_jobs, semente_servidores = sequencia.generate_state(2).tolist()
+    jobs = gerar_jobs(num_jobs, distribuicao, proporcao_multicore, semente_jobs)
+    servidores = gerar_servidores(num_servidores, semente_servidores)
+    return jobs, servidores
+
+# Medições de uma instância
+def medir_instancia(jobs, servidores, tamanho_populacao, taxa_mutacao, tamanho_torneio, repeticoes, semente):
+    """
+    Mede simula_exec, fitness (lista de tuplas), fitness_vetorizado e uma geração completa do GA
+    em lista e do vetorizado. Retorna um dict operação -> segundos (None quando a operação foi ignorada).
+    """
+    instancia = Instancia(jobs, servidores)
+    rng = np.random.default_rng(semente)
+    populacao = inicializa_populacao_vetorizada(tamanho_populacao, instancia, rng)
+    medicoes = {}
+
+    if len(jobs) <= LIMITE_JOBS_SIMULACAO:
+        individuos = [para_individuo(cromossomo, instancia) for cromossomo in populacao]
+        medicoes['simula_exec'] = cronometrar(lambda: simula_exec(individuos[0], jobs, servidores, instancia), repeticoes)
+        medicoes['fitness'] = cronometrar(lambda: fitness(individuos, jobs, servidores, instancia), repeticoes)
+
+        rng_lista = random.Random(semente)
+        def geracao_lista():
+            fitness_populacao = fitness(individuos, jobs, servidores, instancia)
+            gerar_nova_populacao(individuos, fitness_populacao, jobs, servidores, tamanho_torneio, taxa_mutacao,
+                                 rng=rng_lista)
+        medicoes['geracao_lista'] = cronometrar(geracao_lista, repeticoes)
+    else:
+        medicoes['simula_exec'] = medicoes['fitness'] = medicoes['geracao_lista'] = None
+
+    medicoes['fitness_vetorizado'] = cronometrar(lambda: fitness_vetorizado(populacao, instancia), repeticoes)
+
+    def geracao():
+        fitness_populacao, _ = fitness_vetorizado(populacao, instancia)
+        gerar_nova_populacao_vetorizada(populacao.copy(), fitness_populacao, tamanho_torneio, taxa_mutacao,
+                                        instancia.num_servidores, rng)
+    medicoes['geracao_vetorizada'] = cronometrar(geracao, repeticoes)
+    return medicoes
+
+# Execução da grade
+def executar_benchmark(arquivo_saida, num_jobs=NUM_JOBS, num_servidores=NUM_SERVIDORES,
+                       distribuicoes=DISTRIBUICOES_TAMANHO, proporcoes_multicore=PROPORCOES_MULTICORE,
+                       tamanho_populacao=30, taxa_mutacao=0.1, tamanho_torneio=3, repeticoes=3, semente=0):
+    """
+    Mede todas as combinações da grade e acrescenta um registro JSON por linha ao fim de arquivo_saida,
+    de modo que execuções sucessivas (por exemplo, antes e depois de uma mudança) ficam no mesmo arquivo.
+    Combinações cuja matriz de tempos excede LIMITE_ELEMENTOS_MATRIZ são registradas como ignoradas.
+    """
+    ambiente = {'python': platform.python_version(), 'numpy': np.__version__, 'maquina': platform.machine()}
+    data = time.strftime('%Y-%m-%dT%H:%M:%S')
+    with open(arquivo_saida, mode='a') as file:
+        for n_jobs, n_servidores, distribuicao, proporcao in itertools.product(
+            num_jobs, num_servidores, distribuicoes, proporcoes_multicore
+        ):
+            registro = {
+                'num_jobs': n_jobs,
+                'num_servidores': n_servidores,
+                'distribuicao_tamanho': distribuicao,
+                'proporcao_multicore': proporcao,
+                'tamanho_populacao': tamanho_populacao,
+                'repeticoes': repeticoes,
+                'semente': semente,
+                'data': data,
+                'ambiente': ambiente,
+            }
+            if n_jobs * n_servidores > LIMITE_ELEMENTOS_MATRIZ:
+                registro['ignorado'] = 'matriz de tempos excede LIMITE_ELEMENTOS_MATRIZ'
+            else:
+                jobs, servidores = gerar_instancia(n_jobs, n_servidores, distribuicao, proporcao, semente)
+                registro['segundos'] = medir_instancia(
+                    jobs, servidores, tamanho_populacao, taxa_mutacao, tamanho_torneio, repeticoes, semente
+                )
+            file.write(json.dumps(registro) + '\n')
+            file.flush()
+            print(f"{n_jobs} jobs, {n_servidores} servidores, {distribuicao}, multicore={proporcao}: "
+                  f"{registro.get('segundos', registro.get('ignorado'))}")
+
+# Linha de comando
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade do simulador e do fitness.")
+    parser.add_argument('--saida', default='benchmark.jsonl', help="arquivo JSON lines de resultados (os registros são acrescentados)")
+    parser.add_argument('--jobs', type=int, nargs='+', default=NUM_JOBS)
+    parser.add_argument('--servidores', type=int, nargs='+', default=NUM_SERVIDORES)
+    parser.add_argument('--distribuicoes', nargs='+', default=list(DISTRIBUICOES_TAMANHO), choices=DISTRIBUICOES_TAMANHO)
+    parser.add_argument('--multicore', type=float, nargs='+', default=PROPORCOES_MULTICORE,
+                        help="proporções de jobs com suporta_multicore")
+    parser.add_argument('--tamanho-populacao', type=int, default=30)
+    parser.add_argument('--taxa-mutacao', type=float, default=0.1)
+    parser.add_argument('--tamanho-torneio', type=int, default=3)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    executar_benchmark(
+        args.saida, args.jobs, args.servidores, args.distribuicoes, args.multicore,
+        args.tamanho_populacao, args.taxa_mutacao, args.tamanho_torneio, args.repeticoes, args.semente,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Chave compacta de um indivíduo
+def chave_individuo(individuo):
+    """
+    Gera uma chave de 16 bytes a partir do vetor de atribuições do indivíduo.
+    Aceita tanto a lista de tuplas (servidor_id, job_id) quanto um cromossomo vetorizado.
+    """
+    genes = np.ascontiguousarray(np.asarray(individuo, dtype=np.int64))
+    return hashlib.blake2b(genes.tobytes(), digest_size=16).digest()
+
+# Cache LRU na frente da função de fitness
+class CacheFitness:
+    """
+    Memoriza o fitness de indivíduos já avaliados, com capacidade limitada e descarte LRU.
+    Filhos idênticos aos pais (comuns com torneio e taxa de mutação baixa) e elites repetidas
+    deixam de ser simulados de novo.
+    """
+
+    def __init__(self, capacidade=10000):
+        self.capacidade = capacidade
+        self.valores = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def fitness(self, populacao, avaliar):
+        """
+        Calcula o fitness da população consultando o cache antes de simular.
+        Os indivíduos ausentes do cache são avaliados de uma só vez pela função `avaliar`,
+        que recebe uma lista de indivíduos e devolve a lista de fitness.
+        """
+        chaves = [chave_individuo(individuo) for individuo in populacao]
+        fitness_populacao = [None] * len(populacao)
+
+        # Indivíduos ainda não avaliados, agrupados por chave para simular cópias uma única vez
+        pendentes = {}
+        for i, chave in enumerate(chaves):
+            if chave in self.valores:
+                self.valores.move_to_end(chave)
+                fitness_populacao[i] = self.valores[chave]
+                self.acertos += 1
+            elif chave in pendentes:
+                pendentes[chave].append(i)
+                self.acertos += 1
+            else:
+                pendentes[chave] = [i]
+                self.falhas += 1
+
+        if pendentes:
+            posicoes = list(pendentes.values())
+            calculados = avaliar([populacao[indices[0]] for indices in posicoes])
+            for chave, indices, valor in zip(pendentes, posicoes, calculados):
+                for i in indices:
+                    fitness_populacao[i] = valor
+                self._guardar(chave, valor)
+
+        return fitness_populacao
+
+    def _guardar(self, chave, valor):
+        if self.capacidade <= 0:
+            return
+        self.valores[chave] = valor
+        self.valores.move_to_end(chave)
+        while len(self.valores) > self.capacidade:
+            self.valores.popitem(last=False)
+
+    @property
+    def taxa_acerto(self):
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def __len__(self):
+        return len(self.valores)
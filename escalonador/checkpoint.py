@@ -0,0 +1,155 @@
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+# Estado salvo do algoritmo genético ao final de uma geração. populacao guarda o índice de servidor de cada
+# job (como os cromossomos vetorizados) e ids_jobs/ids_servidores dão o significado de cada coluna e índice.
+# modo é o algoritmo que gerou o checkpoint ('lista' ou 'vetorizada'), já que cada um usa um gerador aleatório.
+Checkpoint = namedtuple('Checkpoint', [
+    'populacao', 'fitness', 'geracao', 'estado_rng', 'melhor', 'melhor_fitness', 'ids_jobs', 'ids_servidores', 'modo',
+])
+
+# Gerador aleatório de cada modo, para checkpoints gravados sem o campo modo
+MODOS_RNG = {'lista': 'random', 'vetorizada': 'numpy'}
+
+# Estado dos geradores aleatórios em JSON
+def estado_rng(rng):
+    """
+    Estado de um numpy.random.Generator ou de um random.Random, serializável em JSON.
+    """
+    if isinstance(rng, np.random.Generator):
+        return {'tipo': 'numpy', 'estado': rng.bit_generator.state}
+    return {'tipo': 'random', 'estado': rng.getstate()}
+
+def restaurar_rng(rng, estado):
+    """
+    Restaura em `rng` um estado obtido com estado_rng (o tipo do gerador precisa ser o mesmo).
+    """
+    if estado['tipo'] == 'numpy':
+        rng.bit_generator.state = estado['estado']
+    else:
+        versao, interno, gauss = estado['estado']
+        rng.setstate((versao, tuple(interno), gauss))
+
+# Gravação e leitura em formato binário compacto (.npz comprimido)
+def salvar_checkpoint(caminho, checkpoint):
+    """
+    Grava o checkpoint em `caminho`. A escrita passa por um arquivo temporário, então uma
+    interrupção no meio da gravação não corrompe o checkpoint anterior.
+    """
+    temporario = f'{caminho}.tmp'
+    with open(temporario, 'wb') as file:
+        np.savez_compressed(
+            file,
+            populacao=np.asarray(checkpoint.populacao),
+            fitness=np.asarray(checkpoint.fitness, dtype=np.float64),
+            geracao=np.int64(checkpoint.geracao),
+            estado_rng=np.array(json.dumps(checkpoint.estado_rng)),
+            melhor=np.asarray(checkpoint.melhor),
+            melhor_fitness=np.float64(checkpoint.melhor_fitness),
+            ids_jobs=np.asarray(checkpoint.ids_jobs, dtype=np.int64),
+            ids_servidores=np.asarray(checkpoint.ids_servidores, dtype=np.int64),
+            modo=np.array(checkpoint.modo),
+        )
+    os.replace(temporario, caminho)
+
+def carregar_checkpoint(caminho):
+    with np.load(caminho, allow_pickle=False) as dados:
+        estado = json.loads(str(dados['estado_rng']))
+        if 'modo' in dados:
+            modo = str(dados['modo'])
+        else:
+            modo = next(modo for modo, tipo in MODOS_RNG.items() if tipo == estado['tipo'])
+        return Checkpoint(
+            populacao=dados['populacao'],
+            fitness=dados['fitness'],
+            geracao=int(dados['geracao']),
+            estado_rng=estado,
+            melhor=dados['melhor'],
+            melhor_fitness=float(dados['melhor_fitness']),
+            ids_jobs=dados['ids_jobs'],
+            ids_servidores=dados['ids_servidores'],
+            modo=modo,
+        )
+
+def checkpoint_compativel(checkpoint, instancia):
+    """
+    Verdadeiro se o checkpoint foi gerado para os mesmos jobs e servidores, na mesma ordem.
+    """
+    return np.array_equal(checkpoint.ids_jobs, instancia.ids_jobs) and np.array_equal(
+        checkpoint.ids_servidores, instancia.ids_servidores
+    )
+
+def verificar_retomada(checkpoint, instancia, modo, tamanho_populacao):
+    """
+    Levanta ValueError se o checkpoint não puder ser retomado exatamente pelo algoritmo `modo`
+    com a instância e o tamanho de população informados.
+    """
+    if checkpoint.modo != modo:
+        raise ValueError(
+            f"Checkpoint gerado no modo '{checkpoint.modo}' não pode ser retomado no modo '{modo}'; "
+            "use-o como partida a quente (populacao_de_checkpoint)"
+        )
+    if not checkpoint_compativel(checkpoint, instancia):
+        raise ValueError("Checkpoint de outra instância: use populacao_de_checkpoint para uma partida a quente")
+    if len(checkpoint.populacao) != tamanho_populacao:
+        raise ValueError(
+            f"Checkpoint com população de {len(checkpoint.populacao)} indivíduos não pode ser retomado com "
+            f"tamanho_populacao={tamanho_populacao}"
+        )
+
+# Partida a quente com remapeamento para um novo conjunto de jobs
+def remapear_populacao(checkpoint, instancia):
+    """
+    Leva as atribuições do checkpoint para os jobs e servidores da instância, casando por id.
+    Jobs novos e jobs cujo servidor deixou de existir são colocados, em cada indivíduo, no servidor
+    em que terminam mais cedo dada a carga das atribuições mantidas (jobs maiores primeiro).
+    Jobs que não existem mais são descartados. Retorna um array (tamanho_populacao, num_jobs).
+    """
+    tempos = instancia.tempos
+    num_servidores = instancia.num_servidores
+    tamanho_populacao = len(checkpoint.populacao)
+
+    indice_servidor = instancia.indice_servidor
+    mapa_servidores = np.array([indice_servidor.get(servidor_id, -1) for servidor_id in checkpoint.ids_servidores.tolist()])
+    posicao_antiga = {job_id: i for i, job_id in enumerate(checkpoint.ids_jobs.tolist())}
+    antigos = np.array([posicao_antiga.get(job_id, -1) for job_id in instancia.ids_jobs.tolist()], dtype=np.intp)
+
+    populacao = np.full((tamanho_populacao, instancia.num_jobs), -1, dtype=np.intp)
+    mantidos = antigos >= 0
+    if mantidos.any():
+        populacao[:, mantidos] = mapa_servidores[checkpoint.populacao[:, antigos[mantidos]].astype(np.intp)]
+
+    # Carga de cada servidor com as atribuições mantidas
+    atribuidos = populacao >= 0
+    linhas, jobs = np.nonzero(atribuidos)
+    servidores = populacao[linhas, jobs]
+    cargas = np.bincount(
+        linhas * num_servidores + servidores, weights=tempos[jobs, servidores], minlength=tamanho_populacao * num_servidores
+    ).reshape(tamanho_populacao, num_servidores)
+
+    # Earliest finish time para os genes pendentes, job a job, em todos os indivíduos de uma vez
+    pendentes = np.flatnonzero(~atribuidos.all(axis=0))
+    for job in pendentes[np.argsort(-tempos[pendentes].min(axis=1), kind='stable')].tolist():
+        linhas = np.flatnonzero(populacao[:, job] < 0)
+        termino = cargas[linhas] + tempos[job][None, :]
+        escolhidos = np.argmin(termino, axis=1)
+        populacao[linhas, job] = escolhidos
+        cargas[linhas, escolhidos] = termino[np.arange(len(linhas)), escolhidos]
+    return populacao
+
+def populacao_de_checkpoint(checkpoint, instancia, tamanho_populacao, rng):
+    """
+    População inicial para uma partida a quente: os indivíduos do checkpoint remapeados para a
+    instância, dos melhores para os piores. Se o checkpoint tiver menos indivíduos que
+    tamanho_populacao, o restante é aleatório.
+    """
+    ordem = np.argsort(-np.asarray(checkpoint.fitness), kind='stable')[:tamanho_populacao]
+    remapeados = remapear_populacao(checkpoint._replace(populacao=checkpoint.populacao[ordem]), instancia)
+    faltando = tamanho_populacao - len(remapeados)
+    if faltando > 0:
+        aleatorios = rng.integers(0, instancia.num_servidores, size=(faltando, instancia.num_jobs))
+        remapeados = np.concatenate([remapeados, aleatorios])
+    return remapeados
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .criterios_parada import CriterioParada
+
+# Modos que entregam um Progresso por geração, com critérios de parada, ao_gerar e instrumentação
+MODOS_COM_CRITERIOS = ('multiobjetivo', 'sequenciamento', 'vetorizada', 'incremental', 'lista')
+
+# Parâmetros do algoritmo genético (antes variáveis globais de main.py)
+@dataclass
+class ConfiguracaoAG:
+    """
+    Parâmetros de uma execução do algoritmo genético. O modo é escolhido na ordem: ilhas
+    (num_ilhas > 1 ou configuracoes_ilhas), multiobjetivo, sequenciamento, populacao_vetorizada, avaliacao_incremental e,
+    por fim, a população em lista (serial ou em num_processos processos). validar() rejeita campos
+    que o modo escolhido não usa.
+    """
+    tamanho_populacao: int = 30             # Tamanho da população
+    num_geracoes: Optional[int] = 100       # Número de gerações (None = só os demais critérios de parada)
+    taxa_mutacao: float = 0.1               # Probabilidade de mutação
+    tamanho_torneio: int = 3                # Tamanho do torneio de seleção
+    populacao_vetorizada: bool = False      # Usa a população codificada em arrays NumPy (populacao_vetorizada.py)
+    avaliacao_incremental: bool = False     # Avalia filhos pelo delta em relação aos pais (avaliacao_incremental.py)
+    num_processos: Optional[int] = 1        # Processos para avaliar o fitness (1 = serial, None = todos os núcleos)
+    num_ilhas: int = 1                      # Populações independentes em processos separados (1 = sem ilhas)
+    configuracoes_ilhas: Optional[list] = None  # Um dict por ilha com 'tamanho_populacao' e/ou 'taxa_mutacao'
+    intervalo_migracao: int = 10            # Gerações entre migrações no modelo de ilhas
+    num_migrantes: int = 2                  # Melhores indivíduos enviados por ilha a cada migração
+    topologia_ilhas: str = 'anel'           # Topologia de migração: 'anel' ou 'completa'
+    simulacao_recursos: bool = False        # Vários jobs por servidor, limitados por núcleos, memória e banda
+    peso_utilizacao: float = 0.0            # Peso da utilização ponderada no fitness da simulação de recursos
+    multiobjetivo: bool = False             # NSGA-II sobre makespan, espera média e ociosidade (multiobjetivo.py)
+    sequenciamento: bool = False            # Cromossomo com a ordem das filas além da atribuição (sequenciamento.py)
+    objetivo_sequenciamento: str = 'conclusao_ponderada'  # 'makespan' ou 'conclusao_ponderada' pela prioridade
+    fracao_heuristica: float = 0.0          # Fração da população inicial gerada por LPT, min-min, max-min e EFT
+    heuristicas: Optional[tuple] = None     # Nomes de heuristicas.HEURISTICAS usados na semente (None = heuristicas_padrao)
+    num_elites_busca_local: int = 0         # Melhores indivíduos refinados por busca local a cada geração (incremental)
+    prazo_s: Optional[float] = None         # Tempo máximo de execução em segundos (None = sem prazo)
+    geracoes_sem_melhora: Optional[int] = None  # Para após essas gerações sem melhorar o melhor fitness
+    fitness_alvo: Optional[float] = None    # Para ao atingir esse fitness
+    diversidade_minima: Optional[float] = None  # Para quando a diversidade da população cai abaixo desse valor
+    semente: Optional[int] = None           # Semente dos geradores aleatórios (None = aleatória)
+    tamanho_cache_fitness: int = 10000      # Indivíduos memorizados no cache de fitness (0 = sem cache)
+    imprimir_geracoes: bool = False         # Imprime as estatísticas de cada geração
+    arquivo_metricas: Optional[str] = None  # Arquivo JSON lines com as estatísticas de cada geração
+    arquivo_checkpoint: Optional[str] = None  # Arquivo .npz em que o estado da execução é salvo (lista e vetorizada)
+    intervalo_checkpoint: Optional[int] = None  # Gerações entre checkpoints (None = só ao final)
+    checkpoint_inicial: Optional[str] = None  # Checkpoint de onde partir (lista e vetorizada)
+    retomar: bool = False                   # Retoma exatamente o checkpoint_inicial; senão, partida a quente remapeada
+
+    @property
+    def usa_ilhas(self):
+        return self.num_ilhas > 1 or bool(self.configuracoes_ilhas)
+
+    @property
+    def modo(self):
+        """
+        Modo escolhido: 'ilhas', 'multiobjetivo', 'sequenciamento', 'vetorizada', 'incremental' ou 'lista'.
+        """
+        if self.usa_ilhas:
+            return 'ilhas'
+        if self.multiobjetivo:
+            return 'multiobjetivo'
+        if self.sequenciamento:
+            return 'sequenciamento'
+        if self.populacao_vetorizada:
+            return 'vetorizada'
+        if self.avaliacao_incremental:
+            return 'incremental'
+        return 'lista'
+
+    def validar(self):
+        """
+        Levanta ValueError se algum campo configurado não tem efeito no modo escolhido ou se nenhum
+        critério de parada foi configurado (a execução não terminaria).
+        """
+        modo = self.modo
+        criterios = (self.num_geracoes, self.prazo_s, self.geracoes_sem_melhora, self.fitness_alvo, self.diversidade_minima)
+        if all(valor is None for valor in criterios):
+            raise ValueError(
+                "configure ao menos um critério de parada: num_geracoes, prazo_s, geracoes_sem_melhora, "
+                "fitness_alvo ou diversidade_minima"
+            )
+        if modo == 'ilhas' and self.num_geracoes is None:
+            raise ValueError("o modo ilhas precisa de num_geracoes")
+        # Campo configurado e modos em que ele é usado
+        restricoes = [
+            ('simulacao_recursos', self.simulacao_recursos, ('lista',)),
+            ('num_processos', self.num_processos != 1, ('lista',)),
+            ('fracao_heuristica', self.fracao_heuristica > 0,
+             ('lista', 'vetorizada', 'incremental', 'sequenciamento', 'multiobjetivo')),
+            ('heuristicas', self.heuristicas is not None,
+             ('lista', 'vetorizada', 'incremental', 'sequenciamento', 'multiobjetivo')),
+            ('num_elites_busca_local', self.num_elites_busca_local > 0, ('incremental',)),
+            ('arquivo_checkpoint', self.arquivo_checkpoint is not None, ('lista', 'vetorizada')),
+            ('checkpoint_inicial', self.checkpoint_inicial is not None, ('lista', 'vetorizada')),
+            ('prazo_s', self.prazo_s is not None, MODOS_COM_CRITERIOS),
+            ('geracoes_sem_melhora', self.geracoes_sem_melhora is not None, MODOS_COM_CRITERIOS),
+            ('fitness_alvo', self.fitness_alvo is not None, MODOS_COM_CRITERIOS),
+            ('diversidade_minima', self.diversidade_minima is not None, MODOS_COM_CRITERIOS),
+            ('imprimir_geracoes', self.imprimir_geracoes, MODOS_COM_CRITERIOS),
+            ('arquivo_metricas', self.arquivo_metricas is not None, MODOS_COM_CRITERIOS),
+        ]
+        for campo, configurado, modos in restricoes:
+            if configurado and modo not in modos:
+                raise ValueError(f"{campo} não é suportado no modo {modo} (só em: {', '.join(modos)})")
+        if self.heuristicas is not None:
+            from .heuristicas import HEURISTICAS
+
+            desconhecidas = [nome for nome in self.heuristicas if nome not in HEURISTICAS]
+            if desconhecidas:
+                raise ValueError(f"heuristicas desconhecidas: {', '.join(desconhecidas)} (opções: {', '.join(HEURISTICAS)})")
+            if not self.heuristicas:
+                raise ValueError("heuristicas precisa de ao menos um nome (None = heuristicas_padrao)")
+            if self.fracao_heuristica <= 0:
+                raise ValueError("heuristicas só tem efeito com fracao_heuristica > 0")
+        if self.peso_utilizacao and not self.simulacao_recursos:
+            raise ValueError("peso_utilizacao só tem efeito com simulacao_recursos")
+        if self.retomar and self.checkpoint_inicial is None:
+            raise ValueError("retomar=True precisa de checkpoint_inicial")
+
+    def parametros_ilhas(self):
+        """
+        Configuração de cada ilha: as de configuracoes_ilhas completadas com tamanho_populacao e
+        taxa_mutacao globais, ou num_ilhas cópias dos valores globais.
+        """
+        padrao = {'tamanho_populacao': self.tamanho_populacao, 'taxa_mutacao': self.taxa_mutacao}
+        if not self.configuracoes_ilhas:
+            return [dict(padrao) for _ in range(self.num_ilhas)]
+        if self.num_ilhas > 1 and self.num_ilhas != len(self.configuracoes_ilhas):
+            raise ValueError(
+                f"num_ilhas ({self.num_ilhas}) difere do número de configuracoes_ilhas ({len(self.configuracoes_ilhas)})"
+            )
+        return [{**padrao, **configuracao} for configuracao in self.configuracoes_ilhas]
+
+    def criterio(self):
+        """
+        CriterioParada com os critérios configurados.
+        """
+        return CriterioParada(self.num_geracoes, self.prazo_s, self.geracoes_sem_melhora, self.fitness_alvo,
+                              self.diversidade_minima)
@@ -0,0 +1,149 @@
+import copy
+import time
+from collections import namedtuple
+
+import numpy as np
+
+# Estado do algoritmo genético entregue ao final de cada geração: melhor solução até aquela geração
+# (na representação de cada algoritmo) e o seu fitness. diversidade só é calculada quando algum critério
+# ou a instrumentação precisa dela (senão é None) e motivo_parada só é preenchido na última geração.
+Progresso = namedtuple('Progresso', ['geracao', 'melhor', 'melhor_fitness', 'diversidade', 'decorrido_s', 'motivo_parada'])
+
+# Diversidade da população
+def diversidade_populacao(populacao, num_servidores):
+    """
+    Diversidade de uma população (tamanho_populacao, num_jobs) de índices de servidor: fração média,
+    entre os jobs, dos indivíduos que não usam o servidor mais comum daquele job.
+    Vale 0 quando todos os indivíduos são iguais.
+    """
+    tamanho_populacao, num_jobs = populacao.shape
+    if tamanho_populacao == 0 or num_jobs == 0:
+        return 0.0
+    posicoes = populacao.astype(np.intp) + (np.arange(num_jobs) * num_servidores)[None, :]
+    contagens = np.bincount(posicoes.ravel(), minlength=num_jobs * num_servidores).reshape(num_jobs, num_servidores)
+    return float(1.0 - contagens.max(axis=1).mean() / tamanho_populacao)
+
+# Critérios de parada combináveis
+class CriterioParada:
+    """
+    Critérios de parada do algoritmo genético. Cada critério é opcional (None = desligado) e a
+    execução termina assim que qualquer um dos configurados for atingido:
+    - num_geracoes: número máximo de gerações;
+    - prazo_s: tempo de relógio desde iniciar();
+    - geracoes_sem_melhora: gerações seguidas sem melhorar o melhor fitness;
+    - fitness_alvo: melhor fitness maior ou igual ao alvo;
+    - diversidade_minima: diversidade_populacao abaixo do limite (população convergiu).
+    """
+
+    def __init__(self, num_geracoes=None, prazo_s=None, geracoes_sem_melhora=None, fitness_alvo=None, diversidade_minima=None):
+        self.num_geracoes = num_geracoes
+        self.prazo_s = prazo_s
+        self.geracoes_sem_melhora = geracoes_sem_melhora
+        self.fitness_alvo = fitness_alvo
+        self.diversidade_minima = diversidade_minima
+        self.iniciar()
+
+    @property
+    def usa_diversidade(self):
+        return self.diversidade_minima is not None
+
+    def iniciar(self, geracao_inicial=0):
+        """
+        Reinicia o relógio e o histórico de melhora; chamado pelo algoritmo antes da primeira geração
+        (geracao_inicial > 0 ao retomar de um checkpoint).
+        """
+        self.inicio = time.perf_counter()
+        self.melhor_fitness = -np.inf
+        self.ultima_melhora = geracao_inicial
+
+    @property
+    def decorrido_s(self):
+        return time.perf_counter() - self.inicio
+
+    def verificar(self, geracao, melhor_fitness, diversidade=None):
+        """
+        Registra o resultado da geração `geracao` (contada a partir de 0) e retorna o motivo da
+        parada, ou None para continuar.
+        """
+        if melhor_fitness > self.melhor_fitness:
+            self.melhor_fitness = melhor_fitness
+            self.ultima_melhora = geracao
+
+        if self.fitness_alvo is not None and melhor_fitness >= self.fitness_alvo:
+            return 'fitness_alvo'
+        if self.num_geracoes is not None and geracao + 1 >= self.num_geracoes:
+            return 'num_geracoes'
+        if self.prazo_s is not None and self.decorrido_s >= self.prazo_s:
+            return 'prazo'
+        if self.geracoes_sem_melhora is not None and geracao - self.ultima_melhora >= self.geracoes_sem_melhora:
+            return 'sem_melhora'
+        if self.diversidade_minima is not None and diversidade is not None and diversidade < self.diversidade_minima:
+            return 'diversidade'
+        return None
+
+# Critério usado pelos algoritmos a partir dos parâmetros recebidos
+def criterio_padrao(num_geracoes, criterio=None, geracao_inicial=0):
+    """
+    Retorna uma cópia iniciada do critério (o objeto do chamador não é alterado). Sem critério,
+    o algoritmo roda num_geracoes gerações como antes; com critério, num_geracoes vale como limite
+    se o critério não definir o seu. Com os dois em None só os demais critérios encerram a execução.
+    """
+    criterio = copy.copy(criterio) if criterio is not None else CriterioParada()
+    if criterio.num_geracoes is None:
+        criterio.num_geracoes = num_geracoes
+    criterio.iniciar(geracao_inicial)
+    return criterio
+
+# Contabilidade de cada geração, comum a todos os algoritmos genéticos
+class AcompanhamentoGeracoes:
+    """
+    Guarda a melhor solução encontrada e fecha cada geração: diversidade (só quando algum critério
+    ou a instrumentação precisa dela), registro na instrumentação, critério de parada e Progresso.
+    O critério é iniciado por criterio_padrao na criação; ao retomar um checkpoint, melhor e
+    melhor_fitness partem dos valores salvos.
+    """
+
+    def __init__(self, num_geracoes, criterio, instrumentacao, num_servidores, geracao_inicial=0, melhor=None,
+                 melhor_fitness=-1.0):
+        self.criterio = criterio_padrao(num_geracoes, criterio, geracao_inicial)
+        self.instrumentacao = instrumentacao
+        self.num_servidores = num_servidores
+        self.melhor = melhor
+        self.melhor_fitness = melhor_fitness
+
+    def atualizar_melhor(self, fitness, obter_melhor):
+        """
+        Troca a melhor solução se `fitness` a supera. obter_melhor() só é chamado nesse caso,
+        então a cópia do indivíduo não é feita a cada geração.
+        """
+        if fitness > self.melhor_fitness:
+            self.melhor = obter_melhor()
+            self.melhor_fitness = float(fitness)
+
+    def concluir(self, geracao, fitness_populacao, cromossomos, resumo_melhor):
+        """
+        Fecha a geração e retorna o seu Progresso. cromossomos() retorna a população como array
+        (tamanho_populacao, num_jobs) de índices de servidor e resumo_melhor() retorna o makespan,
+        a ociosidade por servidor e um dict de estatísticas extras do melhor indivíduo da geração;
+        cada um só é chamado quando o seu resultado é usado.
+        """
+        diversidade = None
+        if self.criterio.usa_diversidade or self.instrumentacao.ativo:
+            diversidade = diversidade_populacao(cromossomos(), self.num_servidores)
+        if self.instrumentacao.ativo:
+            makespan, ociosidade, extras = resumo_melhor()
+            self.instrumentacao.registrar_geracao(geracao, fitness_populacao, makespan, ociosidade, diversidade, **extras)
+        motivo = self.criterio.verificar(geracao, self.melhor_fitness, diversidade)
+        return Progresso(geracao, self.melhor, self.melhor_fitness, diversidade, self.criterio.decorrido_s, motivo)
+
+# Execução de um algoritmo até o fim
+def ultimo_progresso(iterador, ao_gerar=None):
+    """
+    Consome um iterador de Progresso chamando ao_gerar(progresso), se informado, a cada geração.
+    Retorna o último Progresso (None se nenhuma geração foi concluída).
+    """
+    progresso = None
+    for progresso in iterador:
+        if ao_gerar is not None:
+            ao_gerar(progresso)
+    return progresso
@@ -0,0 +1,40 @@
+import csv
+
+# Carregar servidores dos arquivos CSV
+def carregar_servidores(arquivo_servidores):
+    servidores = []
+    with open(arquivo_servidores, mode='r') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            row = {key.strip(): value.strip() for key, value in row.items()}
+            if 'id' in row and 'num_nucleos' in row and 'frequencia' in row and 'capacidade_memoria' in row and 'capacidade_largura_banda' in row:
+                servidores.append({
+                    'id': int(row['id']),
+                    'num_nucleos': int(row['num_nucleos']),
+                    'frequencia': float(row['frequencia']),
+                    'capacidade_memoria': float(row['capacidade_memoria']),
+                    'capacidade_largura_banda': float(row['capacidade_largura_banda'])
+                })
+            else:
+                print(f"Missing keys in row: {row} (servers.csv)")
+    return servidores
+
+# Carregar jobs dos arquivos CSV
+def carregar_jobs(arquivo_jobs):
+    jobs = []
+    with open(arquivo_jobs, mode='r') as file:
+        reader = csv.DictReader(file)
+        for row in reader:  # Corrected the unmatched parenthesis here
+            row = {key.strip(): value.strip() for key, value in row.items()}
+            if 'id' in row and 'tamanho' in row and 'memoria' in row and 'largura_banda' in row and 'suporta_multicore' in row:
+                jobs.append({
+                    'id': int(row['id']),
+                    'tamanho': float(row['tamanho']),
+                    'memoria': float(row['memoria']),
+                    'largura_banda': float(row['largura_banda']),
+                    'suporta_multicore': int(row['suporta_multicore']),
+                    'prioridade': int(row.get('prioridade') or 1)
+                })
+            else:
+                print(f"Missing keys in row: {row} (jobs.csv)")
+    return jobs
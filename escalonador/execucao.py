@@ -0,0 +1,206 @@
+import dataclasses
+from collections import namedtuple
+from functools import partial
+
+from .configuracao import ConfiguracaoAG
+from .dados import carregar_jobs, carregar_servidores
+from .instancia import Instancia
+from .instrumentacao import Instrumentacao
+
+# Resultado de uma execução: melhor indivíduo (lista de tuplas (servidor_id, job_id)) e a sua simulação
+Resultado = namedtuple('Resultado', ['individuo', 'tempo_total', 'tempo_espera_medio', 'ociosidade_servidores'])
+
+# Execução do algoritmo genético a partir de uma configuração
+class Escalonador:
+    """
+    Ponto de entrada para usar o escalonador dentro de outro programa. Recebe uma ConfiguracaoAG
+    (ou os seus campos como argumentos nomeados) e executa o modo configurado sobre jobs e
+    servidores no formato de carregar_jobs/carregar_servidores, ou sobre uma Instancia (por exemplo
+    do formato colunar).
+    Os módulos de cada modo (ilhas, processos, sequenciamento...) só são importados quando usados.
+    Após executar(), `cache` e `instrumentacao` guardam os objetos usados na última execução e,
+    no modelo de ilhas, `estatisticas_ilhas` guarda as EstatisticasIlhas.
+    No modo multiobjetivo, executar() retorna a solução de menor makespan e `fronte_pareto` guarda
+    o Resultado de cada solução da fronte de Pareto, em ordem crescente de makespan.
+    """
+
+    def __init__(self, configuracao=None, **parametros):
+        if configuracao is None:
+            configuracao = ConfiguracaoAG(**parametros)
+        elif parametros:
+            configuracao = dataclasses.replace(configuracao, **parametros)
+        self.configuracao = configuracao
+        self.cache = None
+        self.instrumentacao = None
+        self.fronte_pareto = None
+        self.estatisticas_ilhas = None
+
+    def executar(self, jobs, servidores, instancia=None, ao_gerar=None, instrumentacao=None):
+        """
+        Executa o algoritmo genético e simula o melhor indivíduo encontrado.
+        ao_gerar(progresso) é chamado ao final de cada geração (não suportado no modelo de ilhas).
+        Sem instrumentacao, uma é criada se a configuração pedir impressão ou arquivo de métricas.
+        Sem jobs e servidores, usa só a instancia; os modos em lista e de ilhas, que trabalham com os
+        dicts, os obtêm de instancia.registros().
+        Levanta ValueError se a configuração (ou ao_gerar/instrumentacao) não é suportada pelo modo escolhido.
+        """
+        configuracao = self.configuracao
+        configuracao.validar()
+        if configuracao.usa_ilhas and (ao_gerar is not None or instrumentacao is not None):
+            raise ValueError("ao_gerar e instrumentacao não são suportados no modo ilhas")
+        if instancia is None:
+            if jobs is None or servidores is None:
+                raise ValueError("executar precisa de jobs e servidores ou de uma instancia")
+            instancia = Instancia(jobs, servidores)
+        elif (jobs is None or servidores is None) and configuracao.modo in ('lista', 'ilhas'):
+            jobs, servidores = instancia.registros()
+        criar_instrumentacao = instrumentacao is None and (configuracao.imprimir_geracoes or configuracao.arquivo_metricas)
+        if criar_instrumentacao:
+            instrumentacao = Instrumentacao(configuracao.arquivo_metricas, imprimir=configuracao.imprimir_geracoes)
+        self.instrumentacao = instrumentacao
+
+        try:
+            individuo = self._executar_modo(jobs, servidores, instancia, ao_gerar, instrumentacao)
+        finally:
+            if criar_instrumentacao:
+                instrumentacao.fechar()
+
+        _, tempo_total, tempo_espera_medio, ociosidade_servidores = self._simulador()(individuo, jobs, servidores, instancia)[:4]
+        return Resultado(individuo, tempo_total, tempo_espera_medio, ociosidade_servidores)
+
+    def executar_csv(self, arquivo_jobs='jobs.csv', arquivo_servidores='servers.csv', **opcoes):
+        """
+        Carrega jobs e servidores dos CSVs e executa o algoritmo genético.
+        """
+        return self.executar(carregar_jobs(arquivo_jobs), carregar_servidores(arquivo_servidores), **opcoes)
+
+    def executar_colunar(self, diretorio, **opcoes):
+        """
+        Carrega a instância do formato colunar (formato_colunar.converter_instancia) e executa o algoritmo genético.
+        """
+        from .formato_colunar import carregar_instancia_colunar
+
+        return self.executar(None, None, instancia=carregar_instancia_colunar(diretorio), **opcoes)
+
+    def _simulador(self):
+        if self.configuracao.simulacao_recursos:
+            from .simulador_recursos import simula_exec_recursos
+            return simula_exec_recursos
+        from .simulador import simula_exec
+        return simula_exec
+
+    def _funcao_fitness(self):
+        if self.configuracao.simulacao_recursos:
+            from .simulador_recursos import fitness_recursos
+            return partial(fitness_recursos, peso_utilizacao=self.configuracao.peso_utilizacao)
+        from .simulador import fitness
+        return fitness
+
+    def _opcoes_checkpoint(self, instancia):
+        """
+        Parâmetros de checkpoint e partida a quente dos algoritmos em lista e vetorizado.
+        """
+        configuracao = self.configuracao
+        opcoes = {
+            'arquivo_checkpoint': configuracao.arquivo_checkpoint,
+            'intervalo_checkpoint': configuracao.intervalo_checkpoint,
+        }
+        if configuracao.checkpoint_inicial is None:
+            return opcoes
+        import numpy as np
+
+        from .checkpoint import carregar_checkpoint, populacao_de_checkpoint
+
+        checkpoint = carregar_checkpoint(configuracao.checkpoint_inicial)
+        if configuracao.retomar:
+            opcoes['checkpoint'] = checkpoint
+        else:
+            opcoes['populacao_inicial'] = populacao_de_checkpoint(
+                checkpoint, instancia, configuracao.tamanho_populacao, np.random.default_rng(configuracao.semente)
+            )
+        return opcoes
+
+    def _executar_modo(self, jobs, servidores, instancia, ao_gerar, instrumentacao):
+        configuracao = self.configuracao
+        criterio = configuracao.criterio()
+        parametros = (configuracao.tamanho_populacao, configuracao.num_geracoes, configuracao.taxa_mutacao,
+                      configuracao.tamanho_torneio)
+        self.cache = None
+        self.fronte_pareto = None
+        self.estatisticas_ilhas = None
+
+        if configuracao.usa_ilhas:
+            from .ilhas import algoritmo_genetico_ilhas
+            from .populacao_vetorizada import para_individuo
+
+            melhor_cromossomo, _, self.estatisticas_ilhas = algoritmo_genetico_ilhas(
+                jobs, servidores, configuracao.parametros_ilhas(), configuracao.num_geracoes, configuracao.intervalo_migracao,
+                configuracao.num_migrantes, configuracao.tamanho_torneio, configuracao.topologia_ilhas,
+                configuracao.semente,
+            )
+            return para_individuo(melhor_cromossomo, instancia)
+
+        if configuracao.multiobjetivo:
+            from .multiobjetivo import nsga2
+            from .populacao_vetorizada import para_individuo
+
+            fronte = nsga2(
+                instancia, *parametros, configuracao.semente, criterio, ao_gerar, instrumentacao,
+                configuracao.fracao_heuristica, configuracao.heuristicas,
+            )
+            simular = self._simulador()
+            self.fronte_pareto = []
+            for cromossomo in fronte.cromossomos:
+                individuo = para_individuo(cromossomo, instancia)
+                self.fronte_pareto.append(Resultado(individuo, *simular(individuo, jobs, servidores, instancia)[1:4]))
+            return self.fronte_pareto[0].individuo
+
+        if configuracao.sequenciamento:
+            from .sequenciamento import algoritmo_genetico_sequenciado, para_individuo_sequenciado
+
+            melhor_atribuicao, melhor_permutacao, _ = algoritmo_genetico_sequenciado(
+                instancia, *parametros, configuracao.objetivo_sequenciamento, semente=configuracao.semente,
+                criterio=criterio, ao_gerar=ao_gerar, instrumentacao=instrumentacao,
+                fracao_heuristica=configuracao.fracao_heuristica, heuristicas=configuracao.heuristicas,
+            )
+            return para_individuo_sequenciado(melhor_atribuicao, melhor_permutacao, instancia)
+
+        if configuracao.populacao_vetorizada:
+            from .populacao_vetorizada import algoritmo_genetico_vetorizado, para_individuo
+
+            melhor_cromossomo, _ = algoritmo_genetico_vetorizado(
+                instancia, *parametros, configuracao.semente, criterio, ao_gerar, instrumentacao,
+                fracao_heuristica=configuracao.fracao_heuristica, heuristicas=configuracao.heuristicas,
+                **self._opcoes_checkpoint(instancia),
+            )
+            return para_individuo(melhor_cromossomo, instancia)
+
+        if configuracao.avaliacao_incremental:
+            from .avaliacao_incremental import algoritmo_genetico_incremental
+            from .populacao_vetorizada import para_individuo
+
+            melhor_estado = algoritmo_genetico_incremental(
+                instancia, *parametros, configuracao.semente, configuracao.fracao_heuristica,
+                configuracao.num_elites_busca_local, criterio=criterio, ao_gerar=ao_gerar, instrumentacao=instrumentacao,
+                heuristicas=configuracao.heuristicas,
+            )
+            return para_individuo(melhor_estado.cromossomo, instancia)
+
+        from .cache_fitness import CacheFitness
+        from .populacao_lista import algoritmo_genetico
+
+        if configuracao.tamanho_cache_fitness:
+            self.cache = CacheFitness(configuracao.tamanho_cache_fitness)
+        opcoes = dict(
+            instancia=instancia, cache=self.cache, criterio=criterio, instrumentacao=instrumentacao,
+            funcao_fitness=self._funcao_fitness(), simular=self._simulador(),
+            fracao_heuristica=configuracao.fracao_heuristica, heuristicas=configuracao.heuristicas,
+            semente=configuracao.semente,
+            **self._opcoes_checkpoint(instancia),
+        )
+        if configuracao.num_processos != 1:
+            from .avaliacao_paralela import AvaliadorParalelo
+
+            with AvaliadorParalelo(jobs, servidores, configuracao.num_processos, opcoes['funcao_fitness']) as avaliador:
+                return algoritmo_genetico(jobs, servidores, *parametros, ao_gerar, avaliador=avaliador, **opcoes)
+        return algoritmo_genetico(jobs, servidores, *parametros, ao_gerar, **opcoes)
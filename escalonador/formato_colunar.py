@@ -0,0 +1,84 @@
+import argparse
+import os
+
+import numpy as np
+
+from .instancia import Instancia
+
+# Colunas e tipos do formato colunar, na mesma ordem dos CSVs
+COLUNAS_JOBS = {
+    'id': np.int64,
+    'tamanho': np.float64,
+    'memoria': np.float64,
+    'largura_banda': np.float64,
+    'suporta_multicore': np.int8,
+    'prioridade': np.int16,
+}
+COLUNAS_SERVIDORES = {
+    'id': np.int64,
+    'num_nucleos': np.int32,
+    'frequencia': np.float64,
+    'capacidade_memoria': np.float64,
+    'capacidade_largura_banda': np.float64,
+}
+
+# Conversão única do CSV para o formato colunar
+def converter_csv(arquivo_csv, diretorio, colunas):
+    """
+    Lê um CSV no esquema de jobs.csv/servers.csv e grava cada coluna como um arquivo .npy
+    em `diretorio`. Colunas opcionais ausentes do CSV (como prioridade) são ignoradas.
+    """
+    with open(arquivo_csv, mode='r') as file:
+        cabecalho = [campo.strip() for campo in file.readline().split(',')]
+    dados = np.loadtxt(arquivo_csv, delimiter=',', skiprows=1, ndmin=2)
+
+    os.makedirs(diretorio, exist_ok=True)
+    for coluna, tipo in colunas.items():
+        if coluna in cabecalho:
+            np.save(os.path.join(diretorio, f'{coluna}.npy'), dados[:, cabecalho.index(coluna)].astype(tipo))
+        elif coluna != 'prioridade':
+            raise ValueError(f"Coluna obrigatória ausente em {arquivo_csv}: {coluna}")
+
+def converter_instancia(arquivo_jobs, arquivo_servidores, diretorio):
+    """
+    Converte jobs.csv e servers.csv para o formato colunar: diretorio/jobs/*.npy e diretorio/servidores/*.npy.
+    """
+    converter_csv(arquivo_jobs, os.path.join(diretorio, 'jobs'), COLUNAS_JOBS)
+    converter_csv(arquivo_servidores, os.path.join(diretorio, 'servidores'), COLUNAS_SERVIDORES)
+
+# Carregamento mapeado em memória
+def carregar_colunas(diretorio, colunas):
+    """
+    Carrega as colunas de um diretório como arrays mapeados em memória (sem cópia).
+    """
+    return {
+        coluna: np.load(os.path.join(diretorio, f'{coluna}.npy'), mmap_mode='r')
+        for coluna in colunas
+        if os.path.exists(os.path.join(diretorio, f'{coluna}.npy'))
+    }
+
+def carregar_jobs_colunar(diretorio):
+    return carregar_colunas(os.path.join(diretorio, 'jobs'), COLUNAS_JOBS)
+
+def carregar_servidores_colunar(diretorio):
+    return carregar_colunas(os.path.join(diretorio, 'servidores'), COLUNAS_SERVIDORES)
+
+def carregar_instancia_colunar(diretorio):
+    """
+    Monta a Instancia a partir do formato colunar, sem passar por dicts de jobs.
+    """
+    return Instancia.de_colunas(carregar_jobs_colunar(diretorio), carregar_servidores_colunar(diretorio))
+
+# Linha de comando
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Converte jobs.csv/servers.csv para o formato colunar (.npy).")
+    parser.add_argument('--jobs', default='jobs.csv')
+    parser.add_argument('--servidores', default='servers.csv')
+    parser.add_argument('diretorio', help="diretório de saída")
+    args = parser.parse_args(argv)
+
+    converter_instancia(args.jobs, args.servidores, args.diretorio)
+    print(f"{args.diretorio} gerado com sucesso!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import csv
+
+import numpy as np
+
+# Distribuições disponíveis para o tamanho dos jobs
+DISTRIBUICOES_TAMANHO = ('uniforme', 'exponencial', 'cauda_longa', 'bimodal')
+
+def sortear_tamanhos(rng, num_jobs, distribuicao='uniforme'):
+    """
+    Sorteia o tamanho (tempo de execução em um servidor de 2.0 GHz sem multicore) de cada job,
+    sempre entre 1.0 e 1000.0.
+    """
+    if distribuicao == 'uniforme':
+        tamanhos = rng.uniform(1.0, 1000.0, num_jobs)
+    elif distribuicao == 'exponencial':
+        tamanhos = rng.exponential(200.0, num_jobs)
+    elif distribuicao == 'cauda_longa':
+        tamanhos = 10.0 * (rng.pareto(1.5, num_jobs) + 1.0)
+    elif distribuicao == 'bimodal':
+        curtos = rng.random(num_jobs) < 0.8
+        tamanhos = np.where(curtos, rng.normal(50.0, 15.0, num_jobs), rng.normal(800.0, 100.0, num_jobs))
+    else:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao} (use uma de {DISTRIBUICOES_TAMANHO})")
+    return np.clip(tamanhos, 1.0, 1000.0)
+
+def gerar_jobs(num_jobs=100, distribuicao_tamanho='uniforme', proporcao_multicore=0.5, semente=None):
+    """
+    Gera a lista de jobs fictícios em memória, no mesmo formato de carregar_jobs.
+    """
+    rng = np.random.default_rng(semente)
+    tamanhos = sortear_tamanhos(rng, num_jobs, distribuicao_tamanho).tolist()
+    memorias = rng.uniform(1.0, 4000.0, num_jobs).tolist()                           # Memória requerida pelo job (em MB)
+    larguras_banda = rng.uniform(1.0, 150.0, num_jobs).tolist()                     # Largura de banda exigida (em Mbps)
+    multicore = (rng.random(num_jobs) < proporcao_multicore).astype(int).tolist()   # Se suporta (1) ou não (0) multi-core
+    prioridades = rng.integers(1, 10, num_jobs).tolist()                            # Define a prioridade do job
+
+    return [
+        {
+            'id': i + 1,
+            'tamanho': tamanhos[i],
+            'memoria': memorias[i],
+            'largura_banda': larguras_banda[i],
+            'suporta_multicore': multicore[i],
+            'prioridade': prioridades[i]
+        } for i in range(num_jobs)
+    ]
+
+def gerar_jobs_csv(nome_arquivo='jobs.csv', num_jobs=100, distribuicao_tamanho='uniforme', proporcao_multicore=0.5, semente=None):
+    # Definir os cabeçalhos do CSV 
+    headers = ['id', 'tamanho', 'memoria', 'largura_banda', 'suporta_multicore', 'prioridade']
+
+    # Gerar dados fictícios para os jobs
+    jobs = gerar_jobs(num_jobs, distribuicao_tamanho, proporcao_multicore, semente)
+
+    # Escrever o arquivo CSV
+    with open(nome_arquivo, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=headers)
+        writer.writeheader()
+        writer.writerows(jobs)
+
+    print(f"{nome_arquivo} gerado com sucesso!")
+
+if __name__ == "__main__":
+    # Chamar a função para gerar o arquivo
+    gerar_jobs_csv()
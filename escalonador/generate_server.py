@@ -0,0 +1,36 @@
+import csv
+import random
+
+def gerar_servidores(num_servidores=10, semente=None):
+    """
+    Gera a lista de servidores fictícios em memória, no mesmo formato de carregar_servidores.
+    """
+    rng = random.Random(semente)
+    return [
+        {
+            'id': i + 1,
+            'num_nucleos': rng.choice([4, 8, 16, 32, 64]),  # Número aleatório de núcleos
+            'frequencia': round(rng.uniform(2.0, 4.0), 2),  # Frequência de CPU entre 2.0 e 4.0 GHz
+            'capacidade_memoria': rng.choice([4, 8, 16, 32, 64, 128]),  # Memória RAM em GB
+            'capacidade_largura_banda': rng.choice([100, 150, 200, 250, 300, 500, 1000])  # Largura de banda em Mbps
+        } for i in range(num_servidores)
+    ]
+
+def gerar_servers_csv(nome_arquivo='servers.csv', num_servidores=10, semente=None):
+    # Definir os cabeçalhos do CSV
+    headers = ['id', 'num_nucleos', 'frequencia', 'capacidade_memoria', 'capacidade_largura_banda']
+
+    # Gerar dados fictícios para os servidores
+    servidores = gerar_servidores(num_servidores, semente)
+
+    # Escrever o arquivo CSV
+    with open(nome_arquivo, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=headers)
+        writer.writeheader()
+        writer.writerows(servidores)
+
+    print(f"{nome_arquivo} gerado com sucesso!")
+
+if __name__ == "__main__":
+    # Chamar a função para gerar o arquivo
+    gerar_servers_csv()
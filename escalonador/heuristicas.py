@@ -0,0 +1,172 @@
+import numpy as np
+
+from .populacao_vetorizada import inicializa_populacao_vetorizada, tipo_gene
+
+# Heurísticas construtivas sobre a matriz de tempos pré-computada
+def menor_termino(instancia, ordem_jobs, cargas=None, cromossomo=None):
+    """
+    Earliest finish time: percorre os jobs na ordem dada e coloca cada um no servidor
+    em que ele termina mais cedo, considerando a carga já atribuída.
+    cargas (carga inicial de cada servidor) e cromossomo (com os demais genes já preenchidos)
+    permitem completar uma atribuição parcial; o cromossomo é alterado no próprio array.
+    """
+    cargas = np.zeros(instancia.num_servidores) if cargas is None else np.array(cargas, dtype=np.float64)
+    if cromossomo is None:
+        cromossomo = np.empty(instancia.num_jobs, dtype=tipo_gene(instancia))
+    tempos = instancia.tempos
+    for job in ordem_jobs.tolist():
+        termino = cargas + tempos[job]
+        servidor = int(np.argmin(termino))
+        cromossomo[job] = servidor
+        cargas[servidor] = termino[servidor]
+    return cromossomo
+
+def eft(instancia):
+    """
+    Earliest finish time na ordem original dos jobs.
+    """
+    return menor_termino(instancia, np.arange(instancia.num_jobs))
+
+def lpt(instancia):
+    """
+    Longest processing time: jobs em ordem decrescente do menor tempo de execução possível,
+    cada um no servidor em que termina mais cedo.
+    """
+    return menor_termino(instancia, np.argsort(-instancia.tempos.min(axis=1), kind='stable'))
+
+def _min_max(instancia, maior):
+    """
+    Min-min (maior=False) e max-min (maior=True). A cada passo calcula, para cada job pendente,
+    o menor término possível; escolhe o job com o menor (min-min) ou o maior (max-min) desses
+    términos e o atribui ao servidor correspondente. Só os jobs cujo melhor servidor acabou de
+    receber carga precisam ser recalculados.
+    """
+    tempos = instancia.tempos
+    num_jobs = instancia.num_jobs
+    cargas = np.zeros(instancia.num_servidores)
+    cromossomo = np.empty(num_jobs, dtype=tipo_gene(instancia))
+
+    melhor_servidor = np.argmin(tempos, axis=1)
+    melhor_termino = tempos[np.arange(num_jobs), melhor_servidor]
+    pendente = np.ones(num_jobs, dtype=bool)
+    excluido = np.inf if not maior else -np.inf
+
+    for _ in range(num_jobs):
+        candidatos = np.where(pendente, melhor_termino, excluido)
+        job = int(np.argmax(candidatos) if maior else np.argmin(candidatos))
+        servidor = int(melhor_servidor[job])
+        cromossomo[job] = servidor
+        cargas[servidor] = melhor_termino[job]
+        pendente[job] = False
+
+        # A carga do servidor escolhido só aumentou; quem não o tinha como melhor não muda
+        afetados = np.flatnonzero(pendente & (melhor_servidor == servidor))
+        if len(afetados):
+            termino = cargas[None, :] + tempos[afetados]
+            melhor_servidor[afetados] = np.argmin(termino, axis=1)
+            melhor_termino[afetados] = termino[np.arange(len(afetados)), melhor_servidor[afetados]]
+    return cromossomo
+
+def min_min(instancia):
+    return _min_max(instancia, maior=False)
+
+def max_min(instancia):
+    return _min_max(instancia, maior=True)
+
+HEURISTICAS = {'lpt': lpt, 'min_min': min_min, 'max_min': max_min, 'eft': eft}
+HEURISTICAS_QUADRATICAS = ('min_min', 'max_min')  # O(num_jobs² x num_servidores) no pior caso
+MAX_JOBS_HEURISTICAS_QUADRATICAS = 5000  # Cerca de 0,5 s cada com 50 servidores
+
+# Heurísticas usadas quando nenhuma lista é informada
+def heuristicas_padrao(instancia):
+    """
+    Todas as HEURISTICAS, sem min-min e max-min em instâncias com mais de
+    MAX_JOBS_HEURISTICAS_QUADRATICAS jobs, em que elas dominariam o tempo da execução.
+    """
+    if instancia.num_jobs > MAX_JOBS_HEURISTICAS_QUADRATICAS:
+        return tuple(nome for nome in HEURISTICAS if nome not in HEURISTICAS_QUADRATICAS)
+    return tuple(HEURISTICAS)
+
+# População inicial semeada por heurísticas
+def populacao_semeada(tamanho_populacao, instancia, rng, fracao_heuristica=0.2, taxa_mutacao=0.05, heuristicas=None):
+    """
+    Inicializa a população com parte dos indivíduos vindos das heurísticas construtivas:
+    cada heurística entra uma vez e o restante da fração é completado com cópias mutadas delas.
+    Os demais indivíduos continuam aleatórios. heuristicas são nomes de HEURISTICAS (None =
+    heuristicas_padrao); só as que cabem na fração semeada são executadas.
+    """
+    populacao = inicializa_populacao_vetorizada(tamanho_populacao, instancia, rng)
+    num_semeados = min(tamanho_populacao, int(round(fracao_heuristica * tamanho_populacao)))
+    if num_semeados == 0:
+        return populacao
+
+    if heuristicas is None:
+        heuristicas = heuristicas_padrao(instancia)
+    if not heuristicas:
+        return populacao
+    sementes = [HEURISTICAS[nome](instancia) for nome in heuristicas[:num_semeados]]
+    for i in range(num_semeados):
+        populacao[i] = sementes[i % len(sementes)]
+        if i >= len(sementes):
+            mutados = rng.random(instancia.num_jobs) < taxa_mutacao
+            populacao[i, mutados] = rng.integers(0, instancia.num_servidores, size=int(mutados.sum()))
+    return populacao
+
+# Busca local (hill climbing) no servidor mais carregado
+def busca_local(estado, max_iteracoes=50, max_candidatos_troca=256, rng=None):
+    """
+    Melhora um EstadoIndividuo no próprio objeto. A cada iteração considera os jobs do servidor
+    mais carregado e aplica o melhor movimento que reduz o makespan: mover um job para outro
+    servidor ou trocá-lo com um job de outro servidor (até max_candidatos_troca jobs sorteados).
+    Para quando nenhum movimento melhora. Retorna o número de movimentos aplicados.
+    """
+    tempos = estado.instancia.tempos
+    num_servidores = estado.instancia.num_servidores
+    if num_servidores < 2:
+        return 0
+
+    aplicados = 0
+    for _ in range(max_iteracoes):
+        cargas = estado.cargas
+        critico = int(np.argmax(cargas))
+        makespan = cargas[critico]
+        jobs_criticos = estado.fila(critico)
+        if len(jobs_criticos) == 0:
+            break
+
+        # Maior carga entre os outros servidores, excluindo o crítico e o servidor de destino
+        ordem = np.argsort(-cargas, kind='stable')
+        segundo, terceiro = ordem[1], ordem[2] if num_servidores > 2 else ordem[1]
+        outros = np.full(num_servidores, cargas[segundo])
+        outros[segundo] = cargas[terceiro] if num_servidores > 2 else 0.0
+
+        # Movimentos: job do servidor crítico para qualquer outro servidor
+        nova_critica = makespan - tempos[jobs_criticos, critico]
+        novo_destino = cargas[None, :] + tempos[jobs_criticos]
+        makespan_mover = np.maximum(np.maximum(nova_critica[:, None], novo_destino), outros[None, :])
+        makespan_mover[:, critico] = np.inf
+        i, destino = np.unravel_index(np.argmin(makespan_mover), makespan_mover.shape)
+        melhor = (makespan_mover[i, destino], 'mover', int(jobs_criticos[i]), int(destino), None)
+
+        # Trocas: job do servidor crítico com um job de outro servidor
+        candidatos = np.flatnonzero(estado.cromossomo != critico)
+        if len(candidatos) > max_candidatos_troca:
+            candidatos = (rng or np.random.default_rng()).choice(candidatos, size=max_candidatos_troca, replace=False)
+        if len(candidatos):
+            servidores_candidatos = estado.cromossomo[candidatos].astype(np.intp)
+            nova_critica = (makespan - tempos[jobs_criticos, critico])[:, None] + tempos[candidatos, critico][None, :]
+            novo_outro = (cargas[servidores_candidatos] - tempos[candidatos, servidores_candidatos])[None, :] \
+                + tempos[jobs_criticos][:, servidores_candidatos]
+            makespan_trocar = np.maximum(np.maximum(nova_critica, novo_outro), outros[servidores_candidatos][None, :])
+            i, j = np.unravel_index(np.argmin(makespan_trocar), makespan_trocar.shape)
+            if makespan_trocar[i, j] < melhor[0]:
+                melhor = (makespan_trocar[i, j], 'trocar', int(jobs_criticos[i]), int(servidores_candidatos[j]), int(candidatos[j]))
+
+        if melhor[0] >= makespan - 1e-12:
+            break
+        _, tipo, job, destino, outro_job = melhor
+        estado.mover(job, destino)
+        if tipo == 'trocar':
+            estado.mover(outro_job, critico)
+        aplicados += 1
+    return aplicados
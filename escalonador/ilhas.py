@@ -0,0 +1,184 @@
+import multiprocessing
+import queue
+import time
+import traceback
+from collections import namedtuple
+
+import numpy as np
+
+from .instancia import Instancia
+from .populacao_vetorizada import fitness_vetorizado, gerar_nova_populacao_vetorizada, inicializa_populacao_vetorizada
+
+TOPOLOGIAS = ('anel', 'completa')
+
+# Estatísticas de uma execução do modelo de ilhas: índice da melhor ilha, melhor fitness de cada ilha,
+# gerações por segundo de cada ilha e a taxa total (todas as ilhas, incluindo o custo dos processos)
+EstatisticasIlhas = namedtuple(
+    'EstatisticasIlhas', ['topologia', 'melhor_ilha', 'fitness_por_ilha', 'geracoes_por_segundo_por_ilha', 'geracoes_por_segundo']
+)
+
+# Intervalo, em segundos, entre verificações dos processos enquanto os resultados não chegam
+INTERVALO_VERIFICACAO_S = 0.5
+
+# Vizinhos de cada ilha na topologia de migração
+def destinos_migracao(num_ilhas, topologia):
+    """
+    Retorna, para cada ilha, a lista de ilhas que recebem os seus migrantes.
+    'anel': a ilha i envia para a ilha i + 1; 'completa': cada ilha envia para todas as outras.
+    """
+    if topologia == 'anel':
+        return [[(i + 1) % num_ilhas] if num_ilhas > 1 else [] for i in range(num_ilhas)]
+    if topologia == 'completa':
+        return [[j for j in range(num_ilhas) if j != i] for i in range(num_ilhas)]
+    raise ValueError(f"Topologia desconhecida: {topologia} (use uma de {TOPOLOGIAS})")
+
+# Execução de uma ilha em um processo separado
+def _executa_ilha(indice, *argumentos):
+    """
+    Executa _evolui_ilha e envia o resultado ao processo principal. Uma exceção na ilha é enviada
+    como ('erro', indice, traceback) para que o processo principal não espere por um resultado que não vem.
+    """
+    resultados = argumentos[-2]
+    try:
+        resultado = _evolui_ilha(indice, *argumentos)
+    except Exception:
+        resultados.put(('erro', indice, traceback.format_exc()))
+        raise
+    resultados.put(('ok', *resultado))
+
+def _evolui_ilha(indice, configuracao, jobs, servidores, num_geracoes, intervalo_migracao, num_migrantes,
+                 tamanho_torneio, destinos, num_origens, caixas, resultados, semente):
+    """
+    Evolui a população de uma ilha e troca os melhores indivíduos com as vizinhas a cada
+    intervalo_migracao gerações. A troca é síncrona e os lotes recebidos são ordenados pela
+    ilha de origem, então o resultado é determinístico para uma semente fixa.
+    """
+    instancia = Instancia(jobs, servidores)
+    rng = np.random.default_rng(semente)
+    taxa_mutacao = configuracao['taxa_mutacao']
+    populacao = inicializa_populacao_vetorizada(configuracao['tamanho_populacao'], instancia, rng)
+
+    melhor_cromossomo = None
+    melhor_fitness = -1.0
+    adiantados = {}
+    inicio = time.perf_counter()
+    for geracao in range(num_geracoes):
+        fitness_populacao, _ = fitness_vetorizado(populacao, instancia)
+
+        indice_melhor = int(np.argmax(fitness_populacao))
+        if fitness_populacao[indice_melhor] > melhor_fitness:
+            melhor_fitness = float(fitness_populacao[indice_melhor])
+            melhor_cromossomo = populacao[indice_melhor].copy()
+
+        # Migração: envia os k melhores e substitui os piores pelos migrantes recebidos
+        if destinos and num_migrantes > 0 and (geracao + 1) % intervalo_migracao == 0 and geracao + 1 < num_geracoes:
+            elite = np.argsort(fitness_populacao, kind='stable')[-num_migrantes:]
+            for destino in destinos:
+                caixas[destino].put((geracao, indice, populacao[elite], fitness_populacao[elite]))
+
+            # Uma vizinha mais rápida pode já ter enviado lotes de migrações seguintes; eles ficam guardados
+            while len(adiantados.setdefault(geracao, [])) < num_origens:
+                lote = caixas[indice].get()
+                adiantados.setdefault(lote[0], []).append(lote[1:])
+            recebidos = sorted(adiantados.pop(geracao), key=lambda lote: lote[0])
+            migrantes = np.concatenate([lote[1] for lote in recebidos])[-len(populacao):]
+            fitness_migrantes = np.concatenate([lote[2] for lote in recebidos])[-len(populacao):]
+
+            piores = np.argsort(fitness_populacao, kind='stable')[:len(migrantes)]
+            populacao[piores] = migrantes
+            fitness_populacao[piores] = fitness_migrantes
+
+        populacao = gerar_nova_populacao_vetorizada(
+            populacao, fitness_populacao, tamanho_torneio, taxa_mutacao, instancia.num_servidores, rng
+        )
+
+    duracao = time.perf_counter() - inicio
+    return indice, melhor_cromossomo, melhor_fitness, num_geracoes / duracao if duracao else 0.0
+
+# Coleta dos resultados das ilhas
+def _coletar_resultados(resultados, processos):
+    """
+    Espera o resultado de cada ilha, verificando periodicamente se algum processo terminou sem
+    enviá-lo. Uma falha em qualquer ilha é levantada como RuntimeError com o traceback da ilha.
+    """
+    por_ilha = []
+    while len(por_ilha) < len(processos):
+        try:
+            resultado = resultados.get(timeout=INTERVALO_VERIFICACAO_S)
+        except queue.Empty:
+            for indice, processo in enumerate(processos):
+                if processo.exitcode not in (None, 0):
+                    raise RuntimeError(f"A ilha {indice} terminou com código {processo.exitcode} sem enviar resultado")
+            continue
+        if resultado[0] == 'erro':
+            raise RuntimeError(f"Falha na ilha {resultado[1]}:\n{resultado[2]}")
+        por_ilha.append(resultado[1:])
+    return sorted(por_ilha, key=lambda resultado: resultado[0])
+
+# Validação dos parâmetros antes de iniciar os processos
+def _validar_parametros(configuracoes_ilhas, num_geracoes, intervalo_migracao, num_migrantes):
+    if not configuracoes_ilhas:
+        raise ValueError("O modelo de ilhas precisa de pelo menos uma ilha")
+    if num_geracoes is None or num_geracoes < 1:
+        raise ValueError(f"O modelo de ilhas precisa de num_geracoes >= 1 (recebido: {num_geracoes})")
+    if intervalo_migracao < 1:
+        raise ValueError(f"intervalo_migracao precisa ser >= 1 (recebido: {intervalo_migracao})")
+    menor_populacao = min(configuracao['tamanho_populacao'] for configuracao in configuracoes_ilhas)
+    if not 0 <= num_migrantes <= menor_populacao:
+        raise ValueError(
+            f"num_migrantes precisa estar entre 0 e o menor tamanho de população das ilhas ({menor_populacao}); "
+            f"recebido: {num_migrantes}"
+        )
+
+# Algoritmo genético em modelo de ilhas
+def algoritmo_genetico_ilhas(jobs, servidores, configuracoes_ilhas, num_geracoes, intervalo_migracao, num_migrantes,
+                             tamanho_torneio, topologia='anel', semente=None):
+    """
+    Executa N populações independentes, uma por processo, cada uma com o seu tamanho de população
+    e taxa de mutação (configuracoes_ilhas é uma lista de dicts com 'tamanho_populacao' e 'taxa_mutacao').
+    A cada intervalo_migracao gerações cada ilha envia os seus num_migrantes melhores indivíduos
+    às vizinhas da topologia ('anel' ou 'completa').
+    Retorna o melhor cromossomo global, o seu fitness e as EstatisticasIlhas da execução.
+    Os parâmetros são validados antes de iniciar os processos (ValueError); se uma ilha falhar,
+    as demais são terminadas e um RuntimeError é levantado.
+    """
+    _validar_parametros(configuracoes_ilhas, num_geracoes, intervalo_migracao, num_migrantes)
+    num_ilhas = len(configuracoes_ilhas)
+    destinos = destinos_migracao(num_ilhas, topologia)
+    num_origens = [sum(i in d for d in destinos) for i in range(num_ilhas)]
+    sementes = np.random.SeedSequence(semente).spawn(num_ilhas)
+
+    contexto = multiprocessing.get_context()
+    caixas = [contexto.Queue() for _ in range(num_ilhas)]
+    resultados = contexto.Queue()
+    processos = [
+        contexto.Process(
+            target=_executa_ilha,
+            args=(i, configuracoes_ilhas[i], jobs, servidores, num_geracoes, intervalo_migracao, num_migrantes,
+                  tamanho_torneio, destinos[i], num_origens[i], caixas, resultados, sementes[i]),
+        )
+        for i in range(num_ilhas)
+    ]
+
+    inicio = time.perf_counter()
+    for processo in processos:
+        processo.start()
+    # Coleta antes do join para que nenhum processo fique bloqueado escrevendo na fila
+    try:
+        por_ilha = _coletar_resultados(resultados, processos)
+    except BaseException:
+        # As demais ilhas podem estar esperando migrantes da ilha que falhou
+        for processo in processos:
+            processo.terminate()
+        raise
+    finally:
+        for processo in processos:
+            processo.join()
+    duracao = time.perf_counter() - inicio
+
+    indice, melhor_cromossomo, melhor_fitness, _ = max(por_ilha, key=lambda resultado: resultado[2])
+    estatisticas = EstatisticasIlhas(
+        topologia, indice, [resultado[2] for resultado in por_ilha], [resultado[3] for resultado in por_ilha],
+        num_ilhas * num_geracoes / duracao,
+    )
+    return melhor_cromossomo, melhor_fitness, estatisticas
@@ -0,0 +1,112 @@
+from functools import cached_property
+
+import numpy as np
+
+# Instância do problema pré-computada
+class Instancia:
+    """
+    Dados do problema pré-computados uma única vez a partir de carregar_jobs/carregar_servidores.
+    Guarda a matriz densa de tempos de execução (jobs x servidores), os mapas id -> índice
+    e os limites usados pelo fitness, que não mudam entre indivíduos nem gerações.
+    """
+
+    def __init__(self, jobs, servidores):
+        campos_jobs = jobs[0].keys() if jobs else ('id', 'tamanho', 'suporta_multicore')
+        colunas_jobs = {campo: np.array([job[campo] for job in jobs]) for campo in campos_jobs}
+        colunas_servidores = {campo: np.array([servidor[campo] for servidor in servidores]) for campo in servidores[0]}
+        self._montar(colunas_jobs, colunas_servidores)
+        self.jobs = jobs
+        self.servidores = servidores
+
+    @classmethod
+    def de_colunas(cls, colunas_jobs, colunas_servidores):
+        """
+        Monta a instância direto de colunas (arrays, possivelmente mapeados em memória) sem criar
+        um dict por job. Nesse caso `jobs` e `servidores` ficam como None.
+        """
+        instancia = cls.__new__(cls)
+        instancia._montar(colunas_jobs, colunas_servidores)
+        instancia.jobs = None
+        instancia.servidores = None
+        return instancia
+
+    def _montar(self, colunas_jobs, colunas_servidores):
+        self.colunas_jobs = colunas_jobs
+        self.colunas_servidores = colunas_servidores
+
+        # Ids na ordem dos jobs e servidores; os mapas id -> índice são montados só quando usados
+        self.ids_jobs = np.asarray(colunas_jobs['id'], dtype=np.int64)
+        self.ids_servidores = np.asarray(colunas_servidores['id'], dtype=np.int64)
+
+        tamanho = np.asarray(colunas_jobs['tamanho'], dtype=np.float64)
+        suporta_multicore = np.asarray(colunas_jobs['suporta_multicore']) != 0
+        frequencia = np.asarray(colunas_servidores['frequencia'], dtype=np.float64)
+        num_nucleos = np.asarray(colunas_servidores['num_nucleos'], dtype=np.float64)
+
+        # Matriz de tempos: jobs sem multicore usam apenas um núcleo do servidor
+        nucleos_usados = np.where(suporta_multicore[:, None], num_nucleos[None, :], 1.0)
+        self.tempos = tamanho[:, None] / (frequencia[None, :] * nucleos_usados)
+
+        # Tempo máximo possível: todos os jobs em sequência no servidor mais lento, sem multicore
+        self.tempo_maximo_possivel = float(tamanho.sum() / frequencia.min())
+
+        # Tempo ideal: jobs no servidor mais rápido com distribuição perfeita entre os servidores
+        mais_rapido = int(np.argmax(frequencia * num_nucleos))
+        self.tempo_ideal = float(self.tempos[:, mais_rapido].sum() / len(frequencia))
+
+    @cached_property
+    def tempo_ideal_recursos(self):
+        """
+        Limite inferior do makespan na simulação com recursos, em que um servidor executa vários jobs
+        ao mesmo tempo: o trabalho total distribuído perfeitamente por todos os núcleos de todos os
+        servidores, ou o job mais demorado no seu servidor mais rápido, o que for maior.
+        """
+        tamanho = np.asarray(self.colunas_jobs['tamanho'], dtype=np.float64)
+        frequencia = np.asarray(self.colunas_servidores['frequencia'], dtype=np.float64)
+        num_nucleos = np.asarray(self.colunas_servidores['num_nucleos'], dtype=np.float64)
+        return float(max(tamanho.sum() / (frequencia * num_nucleos).sum(), self.tempos.min(axis=1).max()))
+
+    @cached_property
+    def indice_job(self):
+        return {job_id: i for i, job_id in enumerate(self.ids_jobs.tolist())}
+
+    @cached_property
+    def indice_servidor(self):
+        return {servidor_id: j for j, servidor_id in enumerate(self.ids_servidores.tolist())}
+
+    def registros(self):
+        """
+        jobs e servidores no formato de carregar_jobs/carregar_servidores. Numa instância montada por
+        de_colunas eles são criados a partir das colunas na primeira chamada (prioridade ausente = 1).
+        """
+        if self.jobs is None:
+            colunas = dict(self.colunas_jobs)
+            colunas.setdefault('prioridade', np.ones(self.num_jobs, dtype=np.int64))
+            self.jobs = _linhas(colunas)
+        if self.servidores is None:
+            self.servidores = _linhas(self.colunas_servidores)
+        return self.jobs, self.servidores
+
+    @property
+    def num_jobs(self):
+        return len(self.ids_jobs)
+
+    @property
+    def num_servidores(self):
+        return len(self.ids_servidores)
+
+    def indices(self, individuo):
+        """
+        Converte um indivíduo (lista de tuplas (servidor_id, job_id)) em arrays de índices
+        de servidor e de job na ordem do indivíduo.
+        """
+        indice_servidor = self.indice_servidor
+        indice_job = self.indice_job
+        servidores_idx = np.fromiter((indice_servidor[s] for s, _ in individuo), dtype=np.int64, count=len(individuo))
+        jobs_idx = np.fromiter((indice_job[j] for _, j in individuo), dtype=np.int64, count=len(individuo))
+        return servidores_idx, jobs_idx
+
+# Dict por linha a partir de colunas
+def _linhas(colunas):
+    valores = [np.asarray(coluna).tolist() for coluna in colunas.values()]
+    return [dict(zip(colunas, linha)) for linha in zip(*valores)]
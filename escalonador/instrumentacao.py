@@ -0,0 +1,156 @@
+import json
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+FASES = ('inicializacao', 'fitness', 'selecao', 'crossover', 'mutacao', 'busca_local')
+
+# Cronômetro de uma fase, reaproveitado a cada entrada
+class _Cronometro:
+    __slots__ = ('totais', 'nome', 'inicio')
+
+    def __init__(self, totais, nome):
+        self.totais = totais
+        self.nome = nome
+        self.inicio = 0.0
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.totais[self.nome] += time.perf_counter() - self.inicio
+
+# Medição de tempos por fase, contadores e estatísticas por geração
+class Instrumentacao:
+    """
+    Mede o tempo gasto em cada fase do algoritmo genético (inicialização, fitness, seleção,
+    crossover, mutação, busca local), conta simulações e acertos do cache e registra as
+    estatísticas de cada geração (melhor e média do fitness, diversidade, makespan e ociosidade
+    do melhor indivíduo, avaliações por segundo).
+    Cada registro é enviado como uma linha JSON para `arquivo` (caminho ou objeto com write),
+    passado como dict para `ao_registrar(registro)` e, com imprimir=True, impresso em uma linha.
+    Sem nenhum destino, só os tempos por fase e os contadores são acumulados (ver resumo()) e os
+    algoritmos não calculam as estatísticas por geração.
+    """
+
+    def __init__(self, arquivo=None, ao_registrar=None, imprimir=False):
+        self.ao_registrar = ao_registrar
+        self.imprimir = imprimir
+        self._fechar_arquivo = isinstance(arquivo, str)
+        self.arquivo = open(arquivo, 'a') if self._fechar_arquivo else arquivo
+
+        self.tempos = dict.fromkeys(FASES, 0.0)
+        self.contadores = {'simulacoes': 0, 'acertos_cache': 0, 'falhas_cache': 0}
+        self._cronometros = {}
+        self.inicio = time.perf_counter()
+        self._ultimo_registro = self.inicio
+        self._simulacoes_ultimo_registro = 0
+
+    @property
+    def ativo(self):
+        return self.arquivo is not None or self.ao_registrar is not None or self.imprimir
+
+    def fase(self, nome):
+        """
+        Context manager que soma o tempo do bloco à fase `nome`.
+        """
+        cronometro = self._cronometros.get(nome)
+        if cronometro is None:
+            self.tempos.setdefault(nome, 0.0)
+            cronometro = self._cronometros[nome] = _Cronometro(self.tempos, nome)
+        return cronometro
+
+    def contar(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def contar_cache(self, cache, acertos_antes, falhas_antes):
+        """
+        Contabiliza uma avaliação feita pelo CacheFitness: só as falhas viram simulações.
+        """
+        falhas = cache.falhas - falhas_antes
+        self.contar('acertos_cache', cache.acertos - acertos_antes)
+        self.contar('falhas_cache', falhas)
+        self.contar('simulacoes', falhas)
+
+    def registrar_geracao(self, geracao, fitness_populacao, makespan=None, ociosidade=None, diversidade=None, **extras):
+        """
+        Monta o registro da geração e o envia para os destinos configurados.
+        ociosidade é um dict servidor_id -> tempo ocioso do melhor indivíduo da geração.
+        """
+        agora = time.perf_counter()
+        fitness_populacao = np.asarray(fitness_populacao, dtype=np.float64)
+        simulacoes = self.contadores['simulacoes']
+        intervalo = agora - self._ultimo_registro
+        registro = {
+            'geracao': geracao,
+            'melhor_fitness': float(fitness_populacao.max()),
+            'media_fitness': float(fitness_populacao.mean()),
+            'diversidade': diversidade,
+            'makespan': makespan,
+            'ociosidade': ociosidade,
+            'simulacoes': simulacoes,
+            'avaliacoes_por_s': (simulacoes - self._simulacoes_ultimo_registro) / intervalo if intervalo > 0 else None,
+            'acertos_cache': self.contadores['acertos_cache'],
+            'decorrido_s': agora - self.inicio,
+            'tempos_s': dict(self.tempos),
+            **extras,
+        }
+        self._ultimo_registro = agora
+        self._simulacoes_ultimo_registro = simulacoes
+
+        if self.arquivo is not None:
+            self.arquivo.write(json.dumps(registro) + '\n')
+        if self.ao_registrar is not None:
+            self.ao_registrar(registro)
+        if self.imprimir:
+            print(formatar_registro(registro))
+        return registro
+
+    def resumo(self):
+        """
+        Tempos totais por fase e contadores acumulados.
+        """
+        return {'tempos_s': dict(self.tempos), **self.contadores, 'decorrido_s': time.perf_counter() - self.inicio}
+
+    def fechar(self):
+        if self._fechar_arquivo:
+            self.arquivo.close()
+        elif self.arquivo is not None:
+            self.arquivo.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+# Instrumentação desligada: mesma interface, sem medir nem registrar nada
+class _SemInstrumentacao:
+    ativo = False
+    _contexto = nullcontext()
+
+    def fase(self, nome):
+        return self._contexto
+
+    def contar(self, nome, quantidade=1):
+        pass
+
+    def contar_cache(self, cache, acertos_antes, falhas_antes):
+        pass
+
+    def registrar_geracao(self, *args, **kwargs):
+        pass
+
+SEM_INSTRUMENTACAO = _SemInstrumentacao()
+
+# Formatação de um registro para exibição
+def formatar_registro(registro):
+    texto = f"Geração {registro['geracao']}: Fitness = {registro['melhor_fitness']}, Média = {registro['media_fitness']:.6f}"
+    if registro['makespan'] is not None:
+        texto += f", Tempo Total = {registro['makespan']} ms"
+    if registro['diversidade'] is not None:
+        texto += f", Diversidade = {registro['diversidade']:.3f}"
+    if registro['avaliacoes_por_s'] is not None:
+        texto += f", Avaliações/s = {registro['avaliacoes_por_s']:.0f}"
+    return texto
@@ -0,0 +1,182 @@
+import itertools
+from collections import namedtuple
+
+import numpy as np
+
+from .criterios_parada import AcompanhamentoGeracoes, ultimo_progresso
+from .heuristicas import populacao_semeada
+from .instrumentacao import SEM_INSTRUMENTACAO
+from .populacao_vetorizada import cargas_servidores, fitness_makespan, gerar_nova_populacao_vetorizada
+from .sequenciamento import tempos_conclusao
+
+# Objetivos minimizados, na ordem das colunas do array de objetivos
+OBJETIVOS = ('makespan', 'tempo_espera_medio', 'ociosidade_total')
+
+# Soluções não dominadas: cromossomos (num_solucoes, num_jobs) e objetivos (num_solucoes, len(OBJETIVOS)),
+# sem repetições e em ordem crescente de makespan
+FrontePareto = namedtuple('FrontePareto', ['cromossomos', 'objetivos'])
+
+# Objetivos de toda a população
+def objetivos_populacao(populacao, instancia):
+    """
+    Calcula makespan, tempo médio de espera e ociosidade total dos servidores de cada indivíduo,
+    com os mesmos valores de simula_exec: cada servidor executa a sua fila na ordem dos jobs da
+    instância, sem intervalos, e todos os jobs chegam em t=0.
+    Retorna um array (tamanho_populacao, 3) com as colunas de OBJETIVOS.
+    """
+    tamanho_populacao, num_jobs = populacao.shape
+    cargas = cargas_servidores(populacao, instancia)
+    makespan = cargas.max(axis=1)
+
+    # A espera de cada job é o seu instante de início: conclusão menos a própria duração
+    ordem_jobs = np.broadcast_to(np.arange(num_jobs), populacao.shape)
+    conclusao = tempos_conclusao(populacao, ordem_jobs, instancia)
+    duracoes = instancia.tempos[ordem_jobs, populacao.astype(np.intp)]
+    tempo_espera_medio = (conclusao - duracoes).mean(axis=1)
+
+    ociosidade_total = makespan * instancia.num_servidores - cargas.sum(axis=1)
+    return np.column_stack([makespan, tempo_espera_medio, ociosidade_total])
+
+# Ordenação rápida por não dominância
+def ordenacao_nao_dominada(objetivos):
+    """
+    Fast non-dominated sort do NSGA-II com a matriz de dominância calculada de uma vez por
+    broadcasting. Retorna o número da fronte de cada indivíduo (0 = não dominados).
+    A matriz tem tamanho_populacao² elementos por objetivo, o que cabe com folga nas populações usadas aqui.
+    """
+    menor_ou_igual = (objetivos[:, None, :] <= objetivos[None, :, :]).all(axis=2)
+    menor = (objetivos[:, None, :] < objetivos[None, :, :]).any(axis=2)
+    domina = menor_ou_igual & menor  # domina[i, j]: i domina j
+
+    frontes = np.full(len(objetivos), -1, dtype=np.intp)
+    dominadores = domina.sum(axis=0)
+    atual = np.flatnonzero(dominadores == 0)
+    for numero in itertools.count():
+        if atual.size == 0:
+            break
+        frontes[atual] = numero
+        dominadores -= domina[atual].sum(axis=0)
+        dominadores[atual] = -1
+        atual = np.flatnonzero(dominadores == 0)
+    return frontes
+
+# Distância de aglomeração
+def distancia_aglomeracao(objetivos, frontes):
+    """
+    Crowding distance de cada indivíduo dentro da sua fronte, com todas as frontes de uma vez:
+    para cada objetivo, os indivíduos são ordenados por (fronte, valor) e cada um soma a distância
+    normalizada entre os vizinhos. Os extremos de cada fronte recebem infinito.
+    """
+    tamanho_populacao, num_objetivos = objetivos.shape
+    distancia = np.zeros(tamanho_populacao)
+    for objetivo in range(num_objetivos):
+        ordem = np.lexsort((objetivos[:, objetivo], frontes))
+        valores = objetivos[ordem, objetivo]
+        frontes_ordenadas = frontes[ordem]
+
+        muda_fronte = frontes_ordenadas[1:] != frontes_ordenadas[:-1]
+        inicio = np.concatenate([[True], muda_fronte])
+        fim = np.concatenate([muda_fronte, [True]])
+        amplitude = (valores[fim] - valores[inicio])[np.cumsum(inicio) - 1]
+
+        vizinhos = np.zeros(tamanho_populacao)
+        vizinhos[1:-1] = valores[2:] - valores[:-2]
+        contribuicao = np.divide(vizinhos, amplitude, out=np.zeros(tamanho_populacao), where=amplitude > 0)
+        contribuicao[inicio | fim] = np.inf
+        distancia[ordem] += contribuicao
+    return distancia
+
+# Posição de cada indivíduo na ordem do NSGA-II
+def posicao_nsga2(frontes, distancia):
+    """
+    Posição de cada indivíduo ordenando por fronte (menor primeiro) e, dentro da fronte, por
+    distância de aglomeração (maior primeiro). 0 é o melhor indivíduo.
+    """
+    posicao = np.empty(len(frontes), dtype=np.intp)
+    posicao[np.lexsort((-distancia, frontes))] = np.arange(len(frontes))
+    return posicao
+
+# Fronte de Pareto sem repetições
+def fronte_pareto(populacao, objetivos, frontes):
+    """
+    Cromossomos da primeira fronte, sem repetições, em ordem crescente de makespan.
+    """
+    cromossomos, indices = np.unique(populacao[frontes == 0], axis=0, return_index=True)
+    objetivos_fronte = objetivos[frontes == 0][indices]
+    ordem = np.lexsort(objetivos_fronte.T[::-1])
+    return FrontePareto(cromossomos[ordem], objetivos_fronte[ordem])
+
+# NSGA-II, geração a geração
+def iterar_nsga2(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente=None,
+                 criterio=None, instrumentacao=None, fracao_heuristica=0.0, heuristicas=None):
+    """
+    Executa o NSGA-II sobre a população vetorizada, minimizando os OBJETIVOS ao mesmo tempo.
+    Os filhos são gerados com os operadores de populacao_vetorizada, com torneio pela ordem
+    (fronte, distância de aglomeração), e pais e filhos disputam as vagas da geração seguinte.
+    Entrega um Progresso cujo melhor é a FrontePareto da geração; melhor_fitness é o fitness de
+    makespan (simulador.calcular_fitness) da solução da fronte com menor makespan, usado pelos
+    critérios de parada. fracao_heuristica e heuristicas semeiam a população inicial como em
+    heuristicas.populacao_semeada.
+    """
+    instrumentacao = instrumentacao or SEM_INSTRUMENTACAO
+    acompanhamento = AcompanhamentoGeracoes(num_geracoes, criterio, instrumentacao, instancia.num_servidores)
+    rng = np.random.default_rng(semente)
+    with instrumentacao.fase('inicializacao'):
+        populacao = populacao_semeada(tamanho_populacao, instancia, rng, fracao_heuristica, heuristicas=heuristicas)
+    with instrumentacao.fase('fitness'):
+        objetivos = objetivos_populacao(populacao, instancia)
+    instrumentacao.contar('simulacoes', len(populacao))
+    with instrumentacao.fase('selecao'):
+        frontes = ordenacao_nao_dominada(objetivos)
+        distancia = distancia_aglomeracao(objetivos, frontes)
+
+    for geracao in itertools.count():
+        # A fronte da geração substitui a anterior mesmo sem melhorar o makespan, pois os demais objetivos mudam
+        fronte = fronte_pareto(populacao, objetivos, frontes)
+        acompanhamento.melhor = fronte
+        acompanhamento.melhor_fitness = float(fitness_makespan(fronte.objetivos[:1, 0], instancia)[0])
+
+        def resumo_melhor():
+            cargas = cargas_servidores(fronte.cromossomos[:1], instancia)[0]
+            ociosidade = dict(zip(instancia.ids_servidores.tolist(), (cargas.max() - cargas).tolist()))
+            return float(fronte.objetivos[0, 0]), ociosidade, {'tamanho_fronte': len(fronte.cromossomos)}
+        progresso = acompanhamento.concluir(
+            geracao, fitness_makespan(objetivos[:, 0], instancia), lambda: populacao, resumo_melhor
+        )
+        yield progresso
+        if progresso.motivo_parada is not None:
+            return
+
+        # Gerar os filhos
+        filhos = gerar_nova_populacao_vetorizada(
+            populacao, -posicao_nsga2(frontes, distancia), tamanho_torneio, taxa_mutacao, instancia.num_servidores,
+            rng, instrumentacao,
+        )
+        with instrumentacao.fase('fitness'):
+            objetivos_filhos = objetivos_populacao(filhos, instancia)
+        instrumentacao.contar('simulacoes', len(filhos))
+
+        # Pais e filhos juntos: ficam os melhores pela ordem (fronte, distância de aglomeração)
+        with instrumentacao.fase('selecao'):
+            candidatos = np.concatenate([populacao, filhos])
+            objetivos_candidatos = np.concatenate([objetivos, objetivos_filhos])
+            frontes_candidatos = ordenacao_nao_dominada(objetivos_candidatos)
+            distancia_candidatos = distancia_aglomeracao(objetivos_candidatos, frontes_candidatos)
+            sobreviventes = np.argsort(posicao_nsga2(frontes_candidatos, distancia_candidatos))[:tamanho_populacao]
+            populacao = candidatos[sobreviventes]
+            objetivos = objetivos_candidatos[sobreviventes]
+            # As frontes dos sobreviventes não mudam; a aglomeração é recalculada sem os descartados
+            frontes = frontes_candidatos[sobreviventes]
+            distancia = distancia_aglomeracao(objetivos, frontes)
+
+# NSGA-II
+def nsga2(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente=None, criterio=None,
+          ao_gerar=None, instrumentacao=None, fracao_heuristica=0.0, heuristicas=None):
+    """
+    Executa iterar_nsga2 até o fim (ver ultimo_progresso).
+    Retorna a FrontePareto da última geração.
+    """
+    return ultimo_progresso(iterar_nsga2(
+        instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente, criterio, instrumentacao,
+        fracao_heuristica, heuristicas,
+    ), ao_gerar).melhor
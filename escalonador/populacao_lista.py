@@ -0,0 +1,207 @@
+import itertools
+import random
+
+import numpy as np
+
+from .checkpoint import Checkpoint, estado_rng, restaurar_rng, salvar_checkpoint, verificar_retomada
+from .criterios_parada import AcompanhamentoGeracoes, ultimo_progresso
+from .heuristicas import populacao_semeada
+from .instancia import Instancia
+from .instrumentacao import SEM_INSTRUMENTACAO
+from .populacao_vetorizada import para_cromossomo, para_individuo
+from .simulador import fitness, simula_exec
+
+# Inicialização de um indivíduo aleatório
+def inicializa_individuo_aleatorio(jobs, servidores, rng=random):
+    """
+    Inicializa um indivíduo aleatoriamente.
+    Um indivíduo é uma lista de tuplas (servidor_id, job_id).
+    """
+    individuo = []
+    for job in jobs:
+        servidor_id = rng.choice(servidores)['id']
+        individuo.append((servidor_id, job['id']))
+    return individuo
+
+# Inicialização da população
+def inicializa_populacao(tamanho_populacao, jobs, servidores, rng=random):
+    """
+    Inicializa uma população de indivíduos aleatoriamente.
+    Cada indivíduo é uma lista de tuplas (servidor_id, job_id).
+    """
+    populacao = [inicializa_individuo_aleatorio(jobs, servidores, rng) for _ in range(tamanho_populacao)]
+    return populacao
+
+# Seleção por torneio
+def selecao_torneio(populacao, fitness, tamanho_torneio, rng=random):
+    """
+    Seleciona um indivíduo da população utilizando o método do torneio.
+    """
+    tamanho_torneio = min(tamanho_torneio, len(populacao))
+
+    torneio = rng.sample(list(zip(populacao, fitness)), tamanho_torneio)
+    vencedor = max(torneio, key=lambda x: x[1])[0]  # Seleciona o indivíduo com maior fitness
+    return vencedor
+
+# Crossover (Recombinação)
+def crossover(pai1, pai2, rng=random):
+    """
+    Realiza o crossover entre dois indivíduos.
+    Gera dois novos indivíduos (filhos).
+    """
+    ponto_corte = rng.randint(1, len(pai1) - 1)
+    filho1 = pai1[:ponto_corte] + pai2[ponto_corte:]
+    filho2 = pai2[:ponto_corte] + pai1[ponto_corte:]
+    return filho1, filho2
+
+# Mutação
+def mutacao(individuo, taxa_mutacao, servidores, rng=random):
+    """
+    Aplica mutação em um indivíduo com uma probabilidade definida.
+    A mutação consiste em trocar o servidor de um job aleatoriamente.
+    """
+    for i in range(len(individuo)):
+        if rng.random() < taxa_mutacao:
+            novo_servidor_id = rng.choice(servidores)['id']
+            individuo[i] = (novo_servidor_id, individuo[i][1])  # Troca o servidor para esse job
+    return individuo
+
+# Substituição (geração da nova população)
+def gerar_nova_populacao(populacao, fitness_populacao, jobs, servidores, tamanho_torneio, taxa_mutacao,
+                         instrumentacao=SEM_INSTRUMENTACAO, rng=random):
+    """
+    Gera uma nova população utilizando seleção, crossover e mutação.
+    """
+    nova_populacao = []
+    while len(nova_populacao) < len(populacao):
+        # Seleção dos pais
+        with instrumentacao.fase('selecao'):
+            pai1 = selecao_torneio(populacao, fitness_populacao, tamanho_torneio, rng)
+            pai2 = selecao_torneio(populacao, fitness_populacao, tamanho_torneio, rng)
+
+        # Crossover
+        with instrumentacao.fase('crossover'):
+            filho1, filho2 = crossover(pai1, pai2, rng)
+
+        # Mutação
+        with instrumentacao.fase('mutacao'):
+            filho1 = mutacao(filho1, taxa_mutacao, servidores, rng)
+            filho2 = mutacao(filho2, taxa_mutacao, servidores, rng)
+
+        # Adiciona os filhos à nova população
+        nova_populacao.append(filho1)
+        nova_populacao.append(filho2)
+
+    # Certificar que o tamanho da população não excede o limite
+    return nova_populacao[:len(populacao)]
+
+# Critério de Parada - Treinamento do Algoritmo Genético
+def iterar_algoritmo_genetico(jobs, servidores, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio,
+                              instancia=None, avaliador=None, cache=None, criterio=None, instrumentacao=None,
+                              funcao_fitness=fitness, simular=simula_exec, fracao_heuristica=0.0, semente=None,
+                              populacao_inicial=None, checkpoint=None, arquivo_checkpoint=None, intervalo_checkpoint=None,
+                              heuristicas=None):
+    """
+    Algoritmo genético com indivíduos em lista de tuplas (servidor_id, job_id); entrega um Progresso
+    por geração como iterar_algoritmo_genetico_vetorizado, com o melhor indivíduo encontrado até ali.
+    funcao_fitness tem a assinatura de simulador.fitness e simular a de simula_exec (por exemplo,
+    fitness_recursos e simula_exec_recursos para a simulação com recursos).
+    Se um AvaliadorParalelo for informado, o fitness da população é calculado no pool de processos.
+    Se um CacheFitness for informado, ele é consultado antes de qualquer avaliação.
+    Só com uma Instrumentacao o melhor indivíduo de cada geração é simulado de novo, para obter makespan e ociosidade.
+    populacao_inicial (array de cromossomos, ver checkpoint.populacao_de_checkpoint), checkpoint,
+    arquivo_checkpoint, intervalo_checkpoint e heuristicas funcionam como em iterar_algoritmo_genetico_vetorizado.
+    """
+    if instancia is None:
+        instancia = Instancia(jobs, servidores)
+    instrumentacao = instrumentacao or SEM_INSTRUMENTACAO
+    rng = random.Random(semente)
+
+    # Função de avaliação: pool de processos ou fitness serial
+    if avaliador is not None:
+        avaliar = avaliador.fitness
+    else:
+        avaliar = lambda populacao: funcao_fitness(populacao, jobs, servidores, instancia)
+
+    # Inicializa a população: checkpoint, partida a quente ou aleatória, com parte dela vinda das
+    # heurísticas construtivas se configurado
+    melhor_individuo = None
+    melhor_fitness = -1.0
+    geracao_inicial = 0
+    with instrumentacao.fase('inicializacao'):
+        if checkpoint is not None:
+            verificar_retomada(checkpoint, instancia, 'lista', tamanho_populacao)
+            restaurar_rng(rng, checkpoint.estado_rng)
+            melhor_individuo = para_individuo(checkpoint.melhor, instancia)
+            melhor_fitness = checkpoint.melhor_fitness
+            geracao_inicial = checkpoint.geracao + 1
+        elif populacao_inicial is not None:
+            populacao = [para_individuo(cromossomo, instancia) for cromossomo in populacao_inicial]
+        elif fracao_heuristica > 0:
+            cromossomos = populacao_semeada(
+                tamanho_populacao, instancia, np.random.default_rng(semente), fracao_heuristica, heuristicas=heuristicas
+            )
+            populacao = [para_individuo(cromossomo, instancia) for cromossomo in cromossomos]
+        else:
+            populacao = inicializa_populacao(tamanho_populacao, jobs, servidores, rng)
+    if checkpoint is not None:
+        # Continua do ponto em que a execução salva parou: gerar a população da próxima geração
+        populacao = gerar_nova_populacao(
+            [para_individuo(cromossomo, instancia) for cromossomo in checkpoint.populacao], checkpoint.fitness.tolist(),
+            jobs, servidores, tamanho_torneio, taxa_mutacao, instrumentacao, rng,
+        )
+    acompanhamento = AcompanhamentoGeracoes(
+        num_geracoes, criterio, instrumentacao, instancia.num_servidores, geracao_inicial, melhor_individuo, melhor_fitness
+    )
+
+    for geracao in itertools.count(geracao_inicial):
+        # Avaliar a população
+        with instrumentacao.fase('fitness'):
+            if cache is not None:
+                acertos_antes, falhas_antes = cache.acertos, cache.falhas
+                fitness_populacao = cache.fitness(populacao, avaliar)
+                instrumentacao.contar_cache(cache, acertos_antes, falhas_antes)
+            else:
+                fitness_populacao = avaliar(populacao)
+                instrumentacao.contar('simulacoes', len(populacao))
+
+        if not fitness_populacao:
+            print("Erro: A população de fitness está vazia.")
+            break
+
+        # Encontrar o melhor indivíduo da geração atual
+        melhor_da_geracao = populacao[fitness_populacao.index(max(fitness_populacao))]
+        acompanhamento.atualizar_melhor(max(fitness_populacao), lambda: melhor_da_geracao)
+
+        cromossomos = lambda: np.stack([para_cromossomo(individuo, instancia) for individuo in populacao])
+        def resumo_melhor():
+            _, tempo_total, tempo_espera_medio, ociosidade_servidores = simular(melhor_da_geracao, jobs, servidores, instancia)[:4]
+            return tempo_total, ociosidade_servidores, {'tempo_espera_medio': tempo_espera_medio}
+        progresso = acompanhamento.concluir(geracao, fitness_populacao, cromossomos, resumo_melhor)
+        if arquivo_checkpoint is not None and (
+            progresso.motivo_parada is not None or (intervalo_checkpoint and (geracao + 1) % intervalo_checkpoint == 0)
+        ):
+            salvar_checkpoint(arquivo_checkpoint, Checkpoint(
+                cromossomos(), fitness_populacao, geracao, estado_rng(rng),
+                para_cromossomo(progresso.melhor, instancia), progresso.melhor_fitness,
+                instancia.ids_jobs, instancia.ids_servidores, 'lista',
+            ))
+        yield progresso
+        if progresso.motivo_parada is not None:
+            break
+
+        # Gerar a nova população
+        populacao = gerar_nova_populacao(
+            populacao, fitness_populacao, jobs, servidores, tamanho_torneio, taxa_mutacao, instrumentacao, rng
+        )
+
+def algoritmo_genetico(jobs, servidores, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, ao_gerar=None,
+                       **opcoes):
+    """
+    Executa iterar_algoritmo_genetico até o fim (ver ultimo_progresso); opcoes são os demais parâmetros dele.
+    Retorna o melhor indivíduo encontrado.
+    """
+    progresso = ultimo_progresso(iterar_algoritmo_genetico(
+        jobs, servidores, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, **opcoes
+    ), ao_gerar)
+    return progresso.melhor if progresso is not None else None
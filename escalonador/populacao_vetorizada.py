@@ -0,0 +1,265 @@
+import itertools
+
+import numpy as np
+
+from .checkpoint import Checkpoint, estado_rng, restaurar_rng, salvar_checkpoint, verificar_retomada
+from .criterios_parada import AcompanhamentoGeracoes, ultimo_progresso
+from .instrumentacao import SEM_INSTRUMENTACAO
+
+# Limite de elementos processados por bloco, para que populações grandes não criem temporários gigantes
+LIMITE_ELEMENTOS_BLOCO = 1 << 22
+
+# Divisão das linhas da população em blocos
+def _blocos(num_linhas, num_colunas):
+    """
+    Gera fatias de linhas cujo número de elementos fica em torno de LIMITE_ELEMENTOS_BLOCO.
+    """
+    passo = max(1, LIMITE_ELEMENTOS_BLOCO // max(1, num_colunas))
+    for inicio in range(0, num_linhas, passo):
+        yield slice(inicio, min(inicio + passo, num_linhas))
+
+# Conversões entre a representação em lista de tuplas e a representação vetorizada
+def para_cromossomo(individuo, instancia):
+    """
+    Converte um indivíduo (lista de tuplas (servidor_id, job_id)) em um array de índices
+    de servidor, onde a posição i corresponde ao i-ésimo job da instância.
+    """
+    servidores_idx, jobs_idx = instancia.indices(individuo)
+    cromossomo = np.empty(instancia.num_jobs, dtype=tipo_gene(instancia))
+    cromossomo[jobs_idx] = servidores_idx
+    return cromossomo
+
+def para_individuo(cromossomo, instancia):
+    """
+    Converte um cromossomo vetorizado de volta para a lista de tuplas (servidor_id, job_id).
+    """
+    servidores_ids = instancia.ids_servidores[cromossomo].tolist()
+    return list(zip(servidores_ids, instancia.ids_jobs.tolist()))
+
+def tipo_gene(instancia):
+    """
+    Menor tipo inteiro capaz de guardar o índice de qualquer servidor da instância.
+    """
+    return np.min_scalar_type(max(instancia.num_servidores - 1, 0))
+
+# Inicialização da população
+def inicializa_populacao_vetorizada(tamanho_populacao, instancia, rng):
+    """
+    Inicializa uma população aleatória como um array (tamanho_populacao, num_jobs)
+    com o índice do servidor atribuído a cada job.
+    """
+    return rng.integers(
+        0, instancia.num_servidores, size=(tamanho_populacao, instancia.num_jobs), dtype=tipo_gene(instancia)
+    )
+
+# Carga de cada servidor para toda a população
+def cargas_servidores(populacao, instancia):
+    """
+    Calcula a carga (soma dos tempos de execução) de cada servidor para cada indivíduo.
+    Retorna um array (tamanho_populacao, num_servidores).
+    """
+    tamanho_populacao, num_jobs = populacao.shape
+    num_servidores = instancia.num_servidores
+    cargas = np.empty((tamanho_populacao, num_servidores), dtype=np.float64)
+    tempos_planos = instancia.tempos.ravel()
+    deslocamento_jobs = (np.arange(num_jobs) * num_servidores)[None, :]
+
+    for bloco in _blocos(tamanho_populacao, num_jobs):
+        genes = populacao[bloco].astype(np.intp)
+        linhas = genes.shape[0]
+        tempos = np.take(tempos_planos, genes + deslocamento_jobs)
+
+        # Desloca o índice de servidor de cada linha para somar todas as cargas com um único bincount
+        posicoes = genes + (np.arange(linhas) * num_servidores)[:, None]
+        cargas[bloco] = np.bincount(
+            posicoes.ravel(), weights=tempos.ravel(), minlength=linhas * num_servidores
+        ).reshape(linhas, num_servidores)
+
+    return cargas
+
+# Função de fitness vetorizada
+def fitness_vetorizado(populacao, instancia):
+    """
+    Calcula o fitness de toda a população de uma vez.
+    Com filas FIFO independentes por servidor, o tempo total (makespan) é a maior carga de servidor,
+    e o fitness segue a mesma fórmula de simulador.calcular_fitness.
+    Retorna o array de fitness e o array de makespans.
+    """
+    makespan = cargas_servidores(populacao, instancia).max(axis=1)
+    return fitness_makespan(makespan, instancia), makespan
+
+def fitness_makespan(makespan, instancia):
+    """
+    Aplica a fórmula de simulador.calcular_fitness a um array de makespans.
+    """
+    tempo_maximo_possivel = instancia.tempo_maximo_possivel
+    fitness_populacao = (tempo_maximo_possivel - makespan) / (tempo_maximo_possivel - instancia.tempo_ideal)
+    fitness_populacao = np.clip(fitness_populacao, 0, 1)
+    fitness_populacao[makespan > tempo_maximo_possivel] = 0
+    return fitness_populacao
+
+# Ociosidade de cada servidor para um cromossomo
+def ociosidade_cromossomo(cromossomo, instancia):
+    """
+    Tempo ocioso de cada servidor (servidor_id -> tempo) até o makespan do cromossomo. Cada servidor
+    executa a sua fila sem intervalos, então a ociosidade é o makespan menos a carga do servidor.
+    """
+    cargas = cargas_servidores(cromossomo[None, :], instancia)[0]
+    return dict(zip(instancia.ids_servidores.tolist(), (cargas.max() - cargas).tolist()))
+
+# Seleção por torneio
+def selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_selecionados, rng):
+    """
+    Realiza num_selecionados torneios de uma só vez e retorna os índices dos vencedores.
+    Os competidores de cada torneio são sorteados com reposição.
+    """
+    competidores = rng.integers(0, len(fitness_populacao), size=(num_selecionados, tamanho_torneio))
+    vencedores = np.argmax(fitness_populacao[competidores], axis=1)
+    return competidores[np.arange(num_selecionados), vencedores]
+
+# Crossover (Recombinação)
+def crossover_vetorizado(pais1, pais2, rng):
+    """
+    Aplica crossover de um ponto a todos os pares de pais de uma vez.
+    Cada par recebe o seu próprio ponto de corte.
+    """
+    num_pares, num_jobs = pais1.shape
+    filhos1 = np.empty_like(pais1)
+    filhos2 = np.empty_like(pais2)
+    if num_jobs < 2:
+        filhos1[:] = pais1
+        filhos2[:] = pais2
+        return filhos1, filhos2
+
+    pontos_corte = rng.integers(1, num_jobs, size=num_pares)
+    colunas = np.arange(num_jobs)
+    for bloco in _blocos(num_pares, num_jobs):
+        antes_do_corte = colunas[None, :] < pontos_corte[bloco, None]
+        filhos1[bloco] = np.where(antes_do_corte, pais1[bloco], pais2[bloco])
+        filhos2[bloco] = np.where(antes_do_corte, pais2[bloco], pais1[bloco])
+    return filhos1, filhos2
+
+# Mutação
+def mutacao_vetorizada(populacao, taxa_mutacao, num_servidores, rng):
+    """
+    Aplica mutação em toda a população, no próprio array.
+    Cada gene troca para um servidor aleatório com probabilidade taxa_mutacao.
+    """
+    tamanho_populacao, num_jobs = populacao.shape
+    for bloco in _blocos(tamanho_populacao, num_jobs):
+        genes = populacao[bloco]
+        mutados = rng.random(genes.shape) < taxa_mutacao
+        genes[mutados] = rng.integers(0, num_servidores, size=int(mutados.sum()))
+    return populacao
+
+# Substituição (geração da nova população)
+def gerar_nova_populacao_vetorizada(populacao, fitness_populacao, tamanho_torneio, taxa_mutacao, num_servidores, rng,
+                                    instrumentacao=SEM_INSTRUMENTACAO):
+    """
+    Gera uma nova população utilizando seleção, crossover e mutação sobre a população inteira.
+    """
+    tamanho_populacao = len(populacao)
+    num_pares = (tamanho_populacao + 1) // 2
+
+    with instrumentacao.fase('selecao'):
+        pais1 = populacao[selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)]
+        pais2 = populacao[selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)]
+
+    with instrumentacao.fase('crossover'):
+        filhos1, filhos2 = crossover_vetorizado(pais1, pais2, rng)
+        nova_populacao = np.concatenate([filhos1, filhos2])[:tamanho_populacao]
+
+    with instrumentacao.fase('mutacao'):
+        return mutacao_vetorizada(nova_populacao, taxa_mutacao, num_servidores, rng)
+
+# Algoritmo genético com população vetorizada, geração a geração
+def iterar_algoritmo_genetico_vetorizado(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio,
+                                         semente=None, criterio=None, instrumentacao=None, populacao_inicial=None,
+                                         checkpoint=None, arquivo_checkpoint=None, intervalo_checkpoint=None,
+                                         fracao_heuristica=0.0, heuristicas=None):
+    """
+    Executa o algoritmo genético usando a população codificada como array de índices de servidor,
+    entregando um Progresso com o melhor cromossomo encontrado até cada geração. O chamador pode
+    interromper a iteração a qualquer momento e usar o último melhor já entregue.
+    A execução termina após num_geracoes gerações ou quando o CriterioParada informado for atingido;
+    com uma Instrumentacao, os tempos por fase e as estatísticas de cada geração são registrados
+    (ver AcompanhamentoGeracoes).
+    populacao_inicial substitui a população aleatória (partida a quente, ver checkpoint.populacao_de_checkpoint).
+    checkpoint retoma exatamente uma execução salva para a mesma instância: população, gerador aleatório
+    e contador de gerações (num_geracoes conta as gerações já feitas).
+    Com arquivo_checkpoint, o estado é salvo a cada intervalo_checkpoint gerações e na última.
+    Com fracao_heuristica > 0 (e sem populacao_inicial), parte da população inicial vem das heurísticas construtivas
+    (heuristicas, como em heuristicas.populacao_semeada).
+    """
+    instrumentacao = instrumentacao or SEM_INSTRUMENTACAO
+    rng = np.random.default_rng(semente)
+    melhor_cromossomo = None
+    melhor_fitness = -1.0
+    geracao_inicial = 0
+    with instrumentacao.fase('inicializacao'):
+        if checkpoint is not None:
+            verificar_retomada(checkpoint, instancia, 'vetorizada', tamanho_populacao)
+            restaurar_rng(rng, checkpoint.estado_rng)
+            melhor_cromossomo = checkpoint.melhor.astype(tipo_gene(instancia))
+            melhor_fitness = checkpoint.melhor_fitness
+            geracao_inicial = checkpoint.geracao + 1
+        elif populacao_inicial is not None:
+            populacao = np.asarray(populacao_inicial).astype(tipo_gene(instancia))
+        elif fracao_heuristica > 0:
+            # Importado aqui porque heuristicas depende deste módulo
+            from .heuristicas import populacao_semeada
+            populacao = populacao_semeada(tamanho_populacao, instancia, rng, fracao_heuristica, heuristicas=heuristicas)
+        else:
+            populacao = inicializa_populacao_vetorizada(tamanho_populacao, instancia, rng)
+    if checkpoint is not None:
+        # Continua do ponto em que a execução salva parou: gerar a população da próxima geração
+        populacao = gerar_nova_populacao_vetorizada(
+            checkpoint.populacao.astype(tipo_gene(instancia)), checkpoint.fitness, tamanho_torneio, taxa_mutacao,
+            instancia.num_servidores, rng, instrumentacao,
+        )
+    acompanhamento = AcompanhamentoGeracoes(
+        num_geracoes, criterio, instrumentacao, instancia.num_servidores, geracao_inicial, melhor_cromossomo, melhor_fitness
+    )
+
+    for geracao in itertools.count(geracao_inicial):
+        # Avaliar a população
+        with instrumentacao.fase('fitness'):
+            fitness_populacao, makespan = fitness_vetorizado(populacao, instancia)
+        instrumentacao.contar('simulacoes', len(populacao))
+
+        # Encontrar o melhor indivíduo da geração atual
+        indice_melhor = int(np.argmax(fitness_populacao))
+        acompanhamento.atualizar_melhor(fitness_populacao[indice_melhor], lambda: populacao[indice_melhor].copy())
+        progresso = acompanhamento.concluir(
+            geracao, fitness_populacao, lambda: populacao,
+            lambda: (float(makespan[indice_melhor]), ociosidade_cromossomo(populacao[indice_melhor], instancia), {}),
+        )
+        if arquivo_checkpoint is not None and (
+            progresso.motivo_parada is not None or (intervalo_checkpoint and (geracao + 1) % intervalo_checkpoint == 0)
+        ):
+            salvar_checkpoint(arquivo_checkpoint, Checkpoint(
+                populacao, fitness_populacao, geracao, estado_rng(rng), progresso.melhor, progresso.melhor_fitness,
+                instancia.ids_jobs, instancia.ids_servidores, 'vetorizada',
+            ))
+        yield progresso
+        if progresso.motivo_parada is not None:
+            return
+
+        # Gerar a nova população
+        populacao = gerar_nova_populacao_vetorizada(
+            populacao, fitness_populacao, tamanho_torneio, taxa_mutacao, instancia.num_servidores, rng, instrumentacao
+        )
+
+# Algoritmo genético com população vetorizada
+def algoritmo_genetico_vetorizado(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente=None,
+                                  criterio=None, ao_gerar=None, instrumentacao=None, **opcoes):
+    """
+    Executa iterar_algoritmo_genetico_vetorizado até o fim (ver ultimo_progresso); opcoes são os
+    parâmetros de partida a quente, checkpoint e heurísticas dele.
+    Retorna o melhor cromossomo encontrado e o seu fitness.
+    """
+    progresso = ultimo_progresso(iterar_algoritmo_genetico_vetorizado(
+        instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, semente, criterio, instrumentacao,
+        **opcoes,
+    ), ao_gerar)
+    return progresso.melhor, progresso.melhor_fitness
@@ -0,0 +1,210 @@
+import itertools
+
+import numpy as np
+
+from .criterios_parada import AcompanhamentoGeracoes, ultimo_progresso
+from .heuristicas import populacao_semeada
+from .instrumentacao import SEM_INSTRUMENTACAO
+from .populacao_vetorizada import (
+    cargas_servidores,
+    crossover_vetorizado,
+    mutacao_vetorizada,
+    ociosidade_cromossomo,
+    selecao_torneio_vetorizada,
+)
+from .simulador import calcular_fitness
+
+OBJETIVOS = ('makespan', 'conclusao_ponderada')
+
+# Pesos de prioridade dos jobs
+def pesos_prioridade(instancia):
+    """
+    Peso de cada job na conclusão ponderada: o valor da coluna prioridade (maior = mais importante).
+    Sem a coluna, todos os jobs têm peso 1.
+    """
+    if 'prioridade' in instancia.colunas_jobs:
+        return np.asarray(instancia.colunas_jobs['prioridade'], dtype=np.float64)
+    return np.ones(instancia.num_jobs)
+
+# Conversão para a lista de tuplas usada por simula_exec
+def para_individuo_sequenciado(atribuicao, permutacao, instancia):
+    """
+    Converte um cromossomo (atribuição, permutação) na lista de tuplas (servidor_id, job_id)
+    na ordem da permutação, que é a ordem FIFO que simula_exec segue em cada servidor.
+    """
+    servidores_ids = instancia.ids_servidores[atribuicao[permutacao]].tolist()
+    return list(zip(servidores_ids, instancia.ids_jobs[permutacao].tolist()))
+
+# Tempos de conclusão de toda a população
+def tempos_conclusao(atribuicoes, permutacoes, instancia):
+    """
+    Calcula o instante de conclusão de cada job para cada indivíduo, com cada servidor executando
+    os seus jobs na ordem em que aparecem na permutação.
+    Retorna um array (tamanho_populacao, num_jobs) alinhado com as permutações.
+    """
+    tamanho_populacao, num_jobs = permutacoes.shape
+    servidores_em_ordem = np.take_along_axis(atribuicoes, permutacoes, axis=1).astype(np.intp)
+    duracoes = instancia.tempos[permutacoes, servidores_em_ordem]
+
+    # Agrupa por servidor mantendo a ordem da permutação dentro de cada grupo
+    chaves = servidores_em_ordem * num_jobs + np.arange(num_jobs)[None, :]
+    ordem = np.argsort(chaves, axis=1)
+    servidores_ordenados = np.take_along_axis(servidores_em_ordem, ordem, axis=1)
+    duracoes_ordenadas = np.take_along_axis(duracoes, ordem, axis=1)
+
+    # Soma acumulada reiniciada no início da fila de cada servidor
+    acumulado = np.cumsum(duracoes_ordenadas, axis=1)
+    inicio_grupo = np.ones_like(servidores_ordenados, dtype=bool)
+    inicio_grupo[:, 1:] = servidores_ordenados[:, 1:] != servidores_ordenados[:, :-1]
+    deslocamento = np.maximum.accumulate(np.where(inicio_grupo, acumulado - duracoes_ordenadas, 0.0), axis=1)
+
+    conclusao = np.empty_like(acumulado)
+    np.put_along_axis(conclusao, ordem, acumulado - deslocamento, axis=1)
+    return conclusao
+
+# Função de fitness com sequenciamento
+def fitness_sequenciado(atribuicoes, permutacoes, instancia, pesos, objetivo='makespan'):
+    """
+    Calcula o fitness da população.
+    'makespan': mesma fórmula de simulador.calcular_fitness.
+    'conclusao_ponderada': tempo_ideal / (tempo_ideal + média de conclusão ponderada pela prioridade),
+    entre 0 e 1, maior quando jobs de alta prioridade terminam antes.
+    """
+    conclusao = tempos_conclusao(atribuicoes, permutacoes, instancia)
+    if objetivo == 'makespan':
+        return np.array([calcular_fitness(makespan, instancia) for makespan in conclusao.max(axis=1).tolist()])
+    if objetivo == 'conclusao_ponderada':
+        conclusao_ponderada = (conclusao * pesos[permutacoes]).sum(axis=1) / pesos.sum()
+        return instancia.tempo_ideal / (instancia.tempo_ideal + conclusao_ponderada)
+    raise ValueError(f"Objetivo desconhecido: {objetivo} (use um de {OBJETIVOS})")
+
+# Crossover de ordem (OX)
+def crossover_ordem(permutacao1, permutacao2, rng):
+    """
+    Order crossover: o filho herda um trecho contíguo da primeira permutação, na mesma posição,
+    e as demais posições recebem os jobs restantes na ordem relativa da segunda permutação.
+    """
+    num_jobs = len(permutacao1)
+    a, b = np.sort(rng.choice(num_jobs + 1, size=2, replace=False))
+    no_trecho = np.zeros(num_jobs, dtype=bool)
+    no_trecho[permutacao1[a:b]] = True
+    restantes = permutacao2[~no_trecho[permutacao2]]
+    return np.concatenate([restantes[:a], permutacao1[a:b], restantes[a:]])
+
+# Mutações de troca e inserção
+def mutacao_ordem(permutacao, taxa_mutacao_ordem, rng):
+    """
+    Com probabilidade taxa_mutacao_ordem troca dois jobs de posição (swap) e, com a mesma
+    probabilidade, retira um job e o reinsere em outra posição (insert). Altera no próprio array.
+    """
+    num_jobs = len(permutacao)
+    if num_jobs < 2:
+        return permutacao
+    if rng.random() < taxa_mutacao_ordem:
+        i, j = rng.choice(num_jobs, size=2, replace=False)
+        permutacao[i], permutacao[j] = permutacao[j], permutacao[i]
+    if rng.random() < taxa_mutacao_ordem:
+        i, j = rng.choice(num_jobs, size=2, replace=False)
+        job = permutacao[i]
+        if i < j:
+            permutacao[i:j] = permutacao[i + 1:j + 1]
+        else:
+            permutacao[j + 1:i + 1] = permutacao[j:i]
+        permutacao[j] = job
+    return permutacao
+
+# Substituição (geração da nova população)
+def gerar_nova_populacao_sequenciada(atribuicoes, permutacoes, fitness_populacao, tamanho_torneio, taxa_mutacao,
+                                     taxa_mutacao_ordem, num_servidores, rng, instrumentacao=SEM_INSTRUMENTACAO):
+    """
+    Gera a nova população: crossover de um ponto e mutação gene a gene nas atribuições,
+    crossover de ordem e mutações de troca/inserção nas permutações.
+    """
+    tamanho_populacao = len(atribuicoes)
+    num_pares = (tamanho_populacao + 1) // 2
+    with instrumentacao.fase('selecao'):
+        pais1 = selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)
+        pais2 = selecao_torneio_vetorizada(fitness_populacao, tamanho_torneio, num_pares, rng)
+
+    with instrumentacao.fase('crossover'):
+        filhos1, filhos2 = crossover_vetorizado(atribuicoes[pais1], atribuicoes[pais2], rng)
+        novas_atribuicoes = np.concatenate([filhos1, filhos2])[:tamanho_populacao]
+    with instrumentacao.fase('mutacao'):
+        mutacao_vetorizada(novas_atribuicoes, taxa_mutacao, num_servidores, rng)
+
+    permutacoes1 = np.empty((num_pares, permutacoes.shape[1]), dtype=permutacoes.dtype)
+    permutacoes2 = np.empty_like(permutacoes1)
+    for k, (i, j) in enumerate(zip(pais1.tolist(), pais2.tolist())):
+        with instrumentacao.fase('crossover'):
+            filho1 = crossover_ordem(permutacoes[i], permutacoes[j], rng)
+        with instrumentacao.fase('mutacao'):
+            permutacoes1[k] = mutacao_ordem(filho1, taxa_mutacao_ordem, rng)
+        with instrumentacao.fase('crossover'):
+            filho2 = crossover_ordem(permutacoes[j], permutacoes[i], rng)
+        with instrumentacao.fase('mutacao'):
+            permutacoes2[k] = mutacao_ordem(filho2, taxa_mutacao_ordem, rng)
+    novas_permutacoes = np.concatenate([permutacoes1, permutacoes2])[:tamanho_populacao]
+
+    return novas_atribuicoes, novas_permutacoes
+
+# Algoritmo genético com sequenciamento, geração a geração
+def iterar_algoritmo_genetico_sequenciado(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio,
+                                          objetivo='conclusao_ponderada', taxa_mutacao_ordem=0.2, semente=None,
+                                          criterio=None, instrumentacao=None, fracao_heuristica=0.0, heuristicas=None):
+    """
+    Executa o algoritmo genético com cromossomo de duas partes: o servidor de cada job e uma
+    permutação global dos jobs que define a ordem da fila de cada servidor.
+    O melhor de cada Progresso é o par (atribuição, permutação) e a diversidade considera só as
+    atribuições. Com fracao_heuristica > 0, parte das atribuições
+    iniciais vem das heurísticas construtivas (heuristicas; as permutações continuam aleatórias).
+    """
+    instrumentacao = instrumentacao or SEM_INSTRUMENTACAO
+    acompanhamento = AcompanhamentoGeracoes(num_geracoes, criterio, instrumentacao, instancia.num_servidores)
+    rng = np.random.default_rng(semente)
+    pesos = pesos_prioridade(instancia)
+    with instrumentacao.fase('inicializacao'):
+        atribuicoes = populacao_semeada(tamanho_populacao, instancia, rng, fracao_heuristica, heuristicas=heuristicas)
+        permutacoes = np.argsort(rng.random((tamanho_populacao, instancia.num_jobs)), axis=1)
+
+    for geracao in itertools.count():
+        # Avaliar a população
+        with instrumentacao.fase('fitness'):
+            fitness_populacao = fitness_sequenciado(atribuicoes, permutacoes, instancia, pesos, objetivo)
+        instrumentacao.contar('simulacoes', len(atribuicoes))
+
+        # Encontrar o melhor indivíduo da geração atual
+        indice_melhor = int(np.argmax(fitness_populacao))
+        acompanhamento.atualizar_melhor(
+            fitness_populacao[indice_melhor], lambda: (atribuicoes[indice_melhor].copy(), permutacoes[indice_melhor].copy())
+        )
+
+        # Cada servidor executa a sua fila sem intervalos, então o makespan não depende da ordem
+        resumo_melhor = lambda: (
+            float(cargas_servidores(atribuicoes[indice_melhor:indice_melhor + 1], instancia).max()),
+            ociosidade_cromossomo(atribuicoes[indice_melhor], instancia), {},
+        )
+        progresso = acompanhamento.concluir(geracao, fitness_populacao, lambda: atribuicoes, resumo_melhor)
+        yield progresso
+        if progresso.motivo_parada is not None:
+            return
+
+        # Gerar a nova população
+        atribuicoes, permutacoes = gerar_nova_populacao_sequenciada(
+            atribuicoes, permutacoes, fitness_populacao, tamanho_torneio, taxa_mutacao, taxa_mutacao_ordem,
+            instancia.num_servidores, rng, instrumentacao,
+        )
+
+# Algoritmo genético com sequenciamento
+def algoritmo_genetico_sequenciado(instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio,
+                                   objetivo='conclusao_ponderada', taxa_mutacao_ordem=0.2, semente=None,
+                                   criterio=None, ao_gerar=None, instrumentacao=None, fracao_heuristica=0.0,
+                                   heuristicas=None):
+    """
+    Executa iterar_algoritmo_genetico_sequenciado até o fim (ver ultimo_progresso).
+    Retorna a melhor atribuição, a melhor permutação e o seu fitness.
+    """
+    progresso = ultimo_progresso(iterar_algoritmo_genetico_sequenciado(
+        instancia, tamanho_populacao, num_geracoes, taxa_mutacao, tamanho_torneio, objetivo, taxa_mutacao_ordem,
+        semente, criterio, instrumentacao, fracao_heuristica, heuristicas,
+    ), ao_gerar)
+    return (*progresso.melhor, progresso.melhor_fitness)
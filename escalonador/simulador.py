@@ -0,0 +1,115 @@
+import heapq
+from collections import deque
+
+from .instancia import Instancia
+
+#  Funções auxiliares para simulação de execução
+def calcular_tempo_execucao(job, servidor, num_nucleos):
+    """
+    Calcula o tempo de execução de um job em um servidor específico.
+    O tempo de execução depende do tamanho do job e da capacidade do servidor.
+    """
+    if job['suporta_multicore'] == 0:
+        tempo_execucao = job['tamanho'] / servidor['frequencia']
+    else:
+        capacidade_computacional = servidor['frequencia'] * num_nucleos
+        tempo_execucao = job['tamanho'] / capacidade_computacional
+    return tempo_execucao
+
+def calcular_tempo_maximo_possivel(jobs, servidores):
+    """
+    Calcula o tempo máximo possível de execução dos jobs em um único servidor.
+    Isso simula a execução de todos os jobs no servidor mais lento de forma sequencial e sem multicore.
+    """
+    servidor_mais_lento = min(servidores, key=lambda s: s['frequencia'])
+    tempo_maximo = sum([calcular_tempo_execucao(job, servidor_mais_lento, 1) for job in jobs])
+    return tempo_maximo
+
+# Simulação de execução de um indivíduo (orientada a eventos)
+def simula_exec(individuo, jobs, servidores, instancia=None):
+    """
+    Simula a execução de um indivíduo (solução) para o problema de escalonamento de jobs.
+    Em vez de avançar o relógio uma unidade por vez, a simulação salta de uma conclusão
+    de job para a próxima usando uma fila de prioridade com o instante em que cada servidor
+    fica livre, o que custa O(jobs log servidores).
+    Os tempos de execução e os limites vêm da Instancia pré-computada; se nenhuma for
+    informada, ela é construída a partir de jobs e servidores.
+    Retorna o tempo máximo possível, o tempo total de execução (makespan), o tempo médio de
+    espera dos jobs e os tempos de ociosidade de cada servidor.
+    """
+    if instancia is None:
+        instancia = Instancia(jobs, servidores)
+
+    # Duração de cada gene do indivíduo, lida da matriz de tempos em uma única operação
+    servidores_idx, jobs_idx = instancia.indices(individuo)
+    duracoes = instancia.tempos[jobs_idx, servidores_idx].tolist()
+
+    # Fila de cada servidor na ordem em que os jobs aparecem no indivíduo
+    servidores_jobs = [deque() for _ in range(instancia.num_servidores)]
+    for servidor, duracao in zip(servidores_idx.tolist(), duracoes):
+        servidores_jobs[servidor].append(duracao)
+
+    soma_inicios = 0.0
+    tempo_ocupado = [0.0] * instancia.num_servidores
+
+    # Eventos (instante, servidor): momento em que o servidor fica livre para o próximo job
+    eventos = [(0.0, servidor) for servidor, fila in enumerate(servidores_jobs) if fila]
+    heapq.heapify(eventos)
+
+    tempo_total = 0.0
+    while eventos:
+        agora, servidor = heapq.heappop(eventos)
+        fila = servidores_jobs[servidor]
+        if not fila:
+            # Servidor terminou sua fila, o último evento marca o fim da sua execução
+            tempo_total = max(tempo_total, agora)
+            continue
+
+        tempo_execucao = fila.popleft()
+        soma_inicios += agora
+        tempo_ocupado[servidor] += tempo_execucao
+        heapq.heappush(eventos, (agora + tempo_execucao, servidor))
+
+    # Todos os jobs chegam em t=0, então a espera de cada job é o seu instante de início
+    tempo_espera_medio = soma_inicios / instancia.num_jobs
+
+    # Um servidor fica ocioso durante todo o makespan em que não está executando jobs
+    ociosidade_servidores = {
+        servidor_id: tempo_total - ocupado
+        for servidor_id, ocupado in zip(instancia.ids_servidores.tolist(), tempo_ocupado)
+    }
+
+    return instancia.tempo_maximo_possivel, tempo_total, tempo_espera_medio, ociosidade_servidores
+
+# Fitness de um único indivíduo a partir do seu tempo total
+def calcular_fitness(tempo_total, instancia):
+    """
+    Converte o tempo total de execução de um indivíduo em um valor de fitness entre 0 e 1,
+    usando os limites pré-computados da instância.
+    """
+    tempo_maximo_possivel = instancia.tempo_maximo_possivel
+
+    # Penaliza soluções que ultrapassam o tempo máximo
+    if tempo_total > tempo_maximo_possivel:
+        return 0  # Pior caso, tempo acima do possível
+
+    # Ajusta o fitness considerando o tempo total e a ociosidade
+    fitness_value = (tempo_maximo_possivel - tempo_total) / (tempo_maximo_possivel - instancia.tempo_ideal)
+    return min(max(fitness_value, 0), 1)  # Garante que o fitness esteja entre 0 e 1
+
+# Função de fitness
+def fitness(população, jobs, servidores, instancia=None):
+    """
+    Calcula o fitness de um indivíduo baseado no tempo total de execução e ociosidade.
+    O fitness varia de 0 (pior caso) a 1 (melhor caso).
+    """
+    if instancia is None:
+        instancia = Instancia(jobs, servidores)
+
+    fitness_populacao = []
+    for individuo in população:
+        # Obter os tempos simulados de execução para o indivíduo
+        _, tempo_total, _, _ = simula_exec(individuo, jobs, servidores, instancia)
+        fitness_populacao.append(calcular_fitness(tempo_total, instancia))
+
+    return fitness_populacao
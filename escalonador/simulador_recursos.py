@@ -0,0 +1,164 @@
+import heapq
+
+import numpy as np
+
+from .instancia import Instancia
+
+# Pesos α (CPU), β (memória) e γ (largura de banda) da função de utilização (modelagem.md)
+PESOS_UTILIZACAO = (0.5, 0.25, 0.25)
+MB_POR_GB = 1024            # capacidade_memoria dos servidores está em GB, memoria dos jobs em MB
+JANELA_BACKFILL = 32        # Jobs da fila examinados a cada liberação de recursos
+
+# Simulação com vários jobs simultâneos por servidor
+def simula_exec_recursos(individuo, jobs, servidores, instancia=None, pesos=PESOS_UTILIZACAO, janela_backfill=JANELA_BACKFILL):
+    """
+    Simula a execução de um indivíduo permitindo vários jobs ao mesmo tempo em cada servidor,
+    dentro dos limites de núcleos, memória e largura de banda.
+    Sempre que recursos são liberados, a fila do servidor é percorrida na ordem do indivíduo
+    (até janela_backfill jobs) e todo job que couber é iniciado, então jobs de um núcleo ocupam
+    os núcleos que sobraram. Um job multicore recebe todos os núcleos livres no seu início (c_ij)
+    e um job sem multicore recebe um núcleo. Demandas maiores que a capacidade do servidor são
+    limitadas à capacidade, e o job roda sozinho.
+    Retorna o tempo máximo possível, o tempo total (makespan), o tempo médio de espera, a ociosidade
+    de cada servidor e a utilização ponderada de CPU/memória/largura de banda de cada servidor.
+    """
+    if instancia is None:
+        instancia = Instancia(jobs, servidores)
+    colunas_jobs = instancia.colunas_jobs
+    colunas_servidores = instancia.colunas_servidores
+    num_servidores = instancia.num_servidores
+
+    servidores_idx, jobs_idx = instancia.indices(individuo)
+    num_nucleos = np.asarray(colunas_servidores['num_nucleos']).astype(int).tolist()
+    frequencia = np.asarray(colunas_servidores['frequencia'], dtype=np.float64).tolist()
+    capacidade_memoria = (np.asarray(colunas_servidores['capacidade_memoria'], dtype=np.float64) * MB_POR_GB).tolist()
+    capacidade_banda = np.asarray(colunas_servidores['capacidade_largura_banda'], dtype=np.float64).tolist()
+
+    # Demandas de cada gene, limitadas à capacidade do servidor escolhido
+    tamanho = np.asarray(colunas_jobs['tamanho'], dtype=np.float64)[jobs_idx].tolist()
+    multicore = (np.asarray(colunas_jobs['suporta_multicore'])[jobs_idx] != 0).tolist()
+    memoria = np.minimum(
+        np.asarray(colunas_jobs['memoria'], dtype=np.float64)[jobs_idx], np.take(capacidade_memoria, servidores_idx)
+    ).tolist()
+    banda = np.minimum(
+        np.asarray(colunas_jobs['largura_banda'], dtype=np.float64)[jobs_idx], np.take(capacidade_banda, servidores_idx)
+    ).tolist()
+
+    # Fila de cada servidor na ordem em que os jobs aparecem no indivíduo
+    filas = [[] for _ in range(num_servidores)]
+    for posicao, servidor in enumerate(servidores_idx.tolist()):
+        filas[servidor].append(posicao)
+
+    nucleos_livres = list(num_nucleos)
+    memoria_livre = list(capacidade_memoria)
+    banda_livre = list(capacidade_banda)
+    nucleos_alocados = [0] * len(individuo)
+    em_execucao = [0] * num_servidores
+    ocupado_desde = [0.0] * num_servidores
+    tempo_ocupado = [0.0] * num_servidores
+    # Integrais de uso (recurso x tempo) para a utilização média de cada servidor
+    uso_cpu = [0.0] * num_servidores
+    uso_memoria = [0.0] * num_servidores
+    uso_banda = [0.0] * num_servidores
+
+    eventos = []  # (instante de conclusão, servidor, posição do job no indivíduo)
+    soma_inicios = 0.0
+
+    def iniciar_jobs(servidor, agora):
+        nonlocal soma_inicios
+        fila = filas[servidor]
+        i = 0
+        examinados = 0
+        while i < len(fila) and examinados < janela_backfill and nucleos_livres[servidor] > 0:
+            posicao = fila[i]
+            examinados += 1
+            if memoria[posicao] > memoria_livre[servidor] or banda[posicao] > banda_livre[servidor]:
+                i += 1
+                continue
+
+            nucleos = nucleos_livres[servidor] if multicore[posicao] else 1
+            duracao = tamanho[posicao] / (frequencia[servidor] * nucleos)
+            nucleos_livres[servidor] -= nucleos
+            memoria_livre[servidor] -= memoria[posicao]
+            banda_livre[servidor] -= banda[posicao]
+            nucleos_alocados[posicao] = nucleos
+
+            uso_cpu[servidor] += nucleos * duracao
+            uso_memoria[servidor] += memoria[posicao] * duracao
+            uso_banda[servidor] += banda[posicao] * duracao
+
+            if em_execucao[servidor] == 0:
+                ocupado_desde[servidor] = agora
+            em_execucao[servidor] += 1
+            soma_inicios += agora
+            heapq.heappush(eventos, (agora + duracao, servidor, posicao))
+            del fila[i]
+
+    for servidor in range(num_servidores):
+        iniciar_jobs(servidor, 0.0)
+
+    tempo_total = 0.0
+    while eventos:
+        agora, servidor, posicao = heapq.heappop(eventos)
+        tempo_total = agora
+
+        # Libera os recursos do job concluído e tenta iniciar os próximos da fila
+        nucleos_livres[servidor] += nucleos_alocados[posicao]
+        memoria_livre[servidor] += memoria[posicao]
+        banda_livre[servidor] += banda[posicao]
+        em_execucao[servidor] -= 1
+        if em_execucao[servidor] == 0:
+            tempo_ocupado[servidor] += agora - ocupado_desde[servidor]
+        iniciar_jobs(servidor, agora)
+
+    tempo_espera_medio = soma_inicios / instancia.num_jobs
+
+    ids_servidores = instancia.ids_servidores.tolist()
+    ociosidade_servidores = {
+        servidor_id: tempo_total - ocupado for servidor_id, ocupado in zip(ids_servidores, tempo_ocupado)
+    }
+
+    # Utilização(j) = α·CPU utilizada/CPU total + β·Memória utilizada/Memória total + γ·Banda utilizada/Banda total
+    alfa, beta, gama = pesos
+    utilizacao_servidores = {}
+    for servidor, servidor_id in enumerate(ids_servidores):
+        capacidade_tempo = tempo_total if tempo_total > 0 else 1.0
+        utilizacao_servidores[servidor_id] = (
+            alfa * uso_cpu[servidor] / (num_nucleos[servidor] * capacidade_tempo)
+            + beta * uso_memoria[servidor] / (capacidade_memoria[servidor] * capacidade_tempo)
+            + gama * uso_banda[servidor] / (capacidade_banda[servidor] * capacidade_tempo)
+        )
+
+    return instancia.tempo_maximo_possivel, tempo_total, tempo_espera_medio, ociosidade_servidores, utilizacao_servidores
+
+# Fitness de um único indivíduo na simulação com recursos
+def calcular_fitness_recursos(tempo_total, instancia):
+    """
+    Mesma fórmula de simulador.calcular_fitness, mas com o limite inferior do modelo concorrente
+    (Instancia.tempo_ideal_recursos): o tempo_ideal do modelo de um job por vez fica acima de makespans
+    alcançáveis com vários jobs por servidor, o que saturava o fitness em 1.
+    """
+    tempo_maximo_possivel = instancia.tempo_maximo_possivel
+    if tempo_total > tempo_maximo_possivel:
+        return 0
+    fitness_value = (tempo_maximo_possivel - tempo_total) / (tempo_maximo_possivel - instancia.tempo_ideal_recursos)
+    return min(max(fitness_value, 0), 1)
+
+# Função de fitness com simulação de recursos
+def fitness_recursos(população, jobs, servidores, instancia=None, peso_utilizacao=0.0, pesos=PESOS_UTILIZACAO):
+    """
+    Calcula o fitness usando simula_exec_recursos.
+    Com peso_utilizacao = 0 o fitness é calcular_fitness_recursos sobre o makespan;
+    valores maiores misturam a utilização média dos servidores (entre 0 e 1) ao fitness.
+    """
+    if instancia is None:
+        instancia = Instancia(jobs, servidores)
+
+    fitness_populacao = []
+    for individuo in população:
+        _, tempo_total, _, _, utilizacao_servidores = simula_exec_recursos(individuo, jobs, servidores, instancia, pesos)
+        utilizacao_media = sum(utilizacao_servidores.values()) / len(utilizacao_servidores)
+        fitness_populacao.append(
+            (1 - peso_utilizacao) * calcular_fitness_recursos(tempo_total, instancia) + peso_utilizacao * utilizacao_media
+        )
+    return fitness_populacao
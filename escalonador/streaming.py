@@ -0,0 +1,248 @@
+import argparse
+import heapq
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from .dados import carregar_servidores
+from .heuristicas import menor_termino
+from .instancia import Instancia
+from .populacao_vetorizada import cargas_servidores, gerar_nova_populacao_vetorizada, inicializa_populacao_vetorizada
+
+CAMPOS_JOB = ('id', 'tamanho', 'memoria', 'largura_banda', 'suporta_multicore')
+
+# Conversão de uma linha JSONL em job
+def converter_job(registro):
+    """
+    Converte um registro JSON no mesmo formato de job de carregar_jobs.
+    Retorna None se faltar algum campo obrigatório.
+    """
+    if not isinstance(registro, dict) or not all(campo in registro for campo in CAMPOS_JOB):
+        return None
+    return {
+        'id': int(registro['id']),
+        'tamanho': float(registro['tamanho']),
+        'memoria': float(registro['memoria']),
+        'largura_banda': float(registro['largura_banda']),
+        'suporta_multicore': int(registro['suporta_multicore']),
+        'prioridade': int(registro.get('prioridade') or 1)
+    }
+
+# Leitura incremental de um arquivo JSONL
+class LeitorJsonl:
+    """
+    Acompanha um arquivo JSON lines que cresce (como `tail -f`), devolvendo apenas as linhas
+    completas escritas desde a última leitura.
+    """
+
+    def __init__(self, caminho, do_inicio=True):
+        self.caminho = caminho
+        self.posicao = 0
+        self.resto = ''
+        if not do_inicio:
+            with open(caminho, mode='r') as file:
+                file.seek(0, 2)
+                self.posicao = file.tell()
+
+    def novos_jobs(self):
+        with open(self.caminho, mode='r') as file:
+            file.seek(self.posicao)
+            dados = file.read()
+            self.posicao = file.tell()
+
+        linhas = (self.resto + dados).split('\n')
+        self.resto = linhas.pop()  # Última linha pode estar incompleta
+        jobs = []
+        for linha in linhas:
+            if not linha.strip():
+                continue
+            try:
+                job = converter_job(json.loads(linha))
+            except (ValueError, TypeError):
+                job = None
+            if job is None:
+                print(f"Linha ignorada, não é um job: {linha[:80]}")
+            else:
+                jobs.append(job)
+        return jobs
+
+# Escalonamento online por janelas
+class EscalonadorOnline:
+    """
+    Escalona jobs que chegam continuamente, em janelas de tempo, com horizonte deslizante: os jobs
+    de janelas anteriores que ainda não começaram voltam ao problema junto com as chegadas novas,
+    e a decisão de cada um pode ser revista até o seu início.
+    Cada janela é resolvida por um GA curto (população e gerações fixas, com orçamento de tempo).
+    Com partida_quente, a população inicial é semeada com a atribuição anterior dos jobs que voltaram
+    (casada pelo id) e com EFT para os jobs novos, considerando o trabalho já em execução em cada
+    servidor; o resultado da janela nunca é pior que essa semente. O fitness é o makespan incluindo
+    esse trabalho, e cada problema é limitado a max_jobs_janela jobs (os pendentes que começariam
+    mais tarde são os que voltam), então a latência de cada decisão não cresce com o backlog acumulado.
+    Os tempos seguem a unidade dos tempos de execução (ms).
+    """
+
+    def __init__(self, servidores, tamanho_populacao=20, num_geracoes=10, taxa_mutacao=0.1, tamanho_torneio=3,
+                 max_jobs_janela=1000, orcamento_ms=50.0, fracao_semeada=0.5, partida_quente=True, semente=None):
+        self.servidores = servidores
+        self.tamanho_populacao = tamanho_populacao
+        self.num_geracoes = num_geracoes
+        self.taxa_mutacao = taxa_mutacao
+        self.tamanho_torneio = tamanho_torneio
+        self.max_jobs_janela = max_jobs_janela
+        self.orcamento_ms = orcamento_ms
+        self.fracao_semeada = fracao_semeada
+        self.partida_quente = partida_quente
+        self.rng = np.random.default_rng(semente)
+
+        self.ids_servidores = [servidor['id'] for servidor in servidores]
+        # Instante em que cada servidor termina todo o trabalho já atribuído
+        self.livre_em = np.zeros(len(servidores))
+        # Jobs atribuídos que ainda não começaram, por servidor: (job, início previsto), em ordem de início
+        self.pendentes = [deque() for _ in servidores]
+
+    def backlog(self, agora):
+        """
+        Trabalho restante em cada servidor no instante `agora`.
+        """
+        return np.maximum(self.livre_em - agora, 0.0)
+
+    def _liberar_pendentes(self, agora, limite):
+        """
+        Retira da fila os até `limite` jobs pendentes que começariam mais tarde, para que voltem ao
+        problema. Como cada servidor é FIFO, eles formam o fim da fila de cada servidor, que passa a
+        terminar no início do primeiro job retirado. Retorna os (job, servidor) retirados em ordem de início
+        e o instante em que cada servidor fica livre sem eles.
+        Os jobs que já começaram saem do início de cada fila, e um heap sobre o fim das filas escolhe
+        os que começariam mais tarde, então o custo depende de `limite` e não do tamanho do backlog.
+        """
+        for fila in self.pendentes:
+            while fila and fila[0][1] <= agora:
+                fila.popleft()
+
+        livre_em = self.livre_em.copy()
+        fins = [(-fila[-1][1], servidor) for servidor, fila in enumerate(self.pendentes) if fila]
+        heapq.heapify(fins)
+        liberados = []
+        while fins and len(liberados) < limite:
+            _, servidor = heapq.heappop(fins)
+            fila = self.pendentes[servidor]
+            job, inicio_previsto = fila.pop()
+            livre_em[servidor] = inicio_previsto
+            liberados.append((job, servidor))
+            if fila:
+                heapq.heappush(fins, (-fila[-1][1], servidor))
+        liberados.reverse()
+        return liberados, np.maximum(livre_em, agora)
+
+    def _populacao_inicial(self, instancia, servidores_anteriores, backlog):
+        populacao = inicializa_populacao_vetorizada(self.tamanho_populacao, instancia, self.rng)
+        if not self.partida_quente:
+            return populacao
+
+        # Semente: jobs que voltaram no servidor em que estavam e jobs novos por EFT sobre o backlog
+        semente = populacao[0].copy()
+        num_anteriores = len(servidores_anteriores)
+        semente[:num_anteriores] = servidores_anteriores
+        cargas = backlog + np.bincount(
+            semente[:num_anteriores].astype(np.intp), weights=instancia.tempos[np.arange(num_anteriores), semente[:num_anteriores]],
+            minlength=instancia.num_servidores,
+        )
+        menor_termino(instancia, np.arange(num_anteriores, instancia.num_jobs), cargas, semente)
+
+        # Variações mutadas da semente
+        num_semeados = max(1, int(self.fracao_semeada * self.tamanho_populacao))
+        populacao[:num_semeados] = semente
+        if num_semeados > 1:
+            variacoes = populacao[1:num_semeados]
+            mutados = self.rng.random(variacoes.shape) < self.taxa_mutacao
+            variacoes[mutados] = self.rng.integers(0, instancia.num_servidores, size=int(mutados.sum()))
+        return populacao
+
+    def _resolver(self, novos, agora):
+        inicio = time.perf_counter()
+        liberados, livre_em = self._liberar_pendentes(agora, self.max_jobs_janela - len(novos))
+        jobs = [job for job, _ in liberados] + novos
+        instancia = Instancia(jobs, self.servidores)
+        backlog = livre_em - agora
+        populacao = self._populacao_inicial(instancia, [servidor for _, servidor in liberados], backlog)
+
+        melhor_cromossomo = None
+        melhor_makespan = np.inf
+        for _ in range(self.num_geracoes):
+            # O makespan da janela inclui o trabalho que já está em cada servidor
+            makespan = (cargas_servidores(populacao, instancia) + backlog).max(axis=1)
+            indice_melhor = int(np.argmin(makespan))
+            if makespan[indice_melhor] < melhor_makespan:
+                melhor_makespan = float(makespan[indice_melhor])
+                melhor_cromossomo = populacao[indice_melhor].copy()
+
+            if (time.perf_counter() - inicio) * 1000 >= self.orcamento_ms:
+                break
+            populacao = gerar_nova_populacao_vetorizada(
+                populacao, -makespan, self.tamanho_torneio, self.taxa_mutacao, instancia.num_servidores, self.rng
+            )
+
+        # Enfileira os jobs na ordem de chegada e atualiza quando cada servidor fica livre
+        decisoes = []
+        duracoes = instancia.tempos[np.arange(instancia.num_jobs), melhor_cromossomo].tolist()
+        for job, servidor, duracao in zip(jobs, melhor_cromossomo.tolist(), duracoes):
+            inicio_previsto = float(livre_em[servidor])
+            livre_em[servidor] = inicio_previsto + duracao
+            self.pendentes[servidor].append((job, inicio_previsto))
+            decisoes.append((job['id'], self.ids_servidores[servidor], inicio_previsto, inicio_previsto + duracao))
+        self.livre_em = livre_em
+        return decisoes
+
+    def escalonar(self, jobs, agora):
+        """
+        Escalona os jobs que chegaram em uma janela, junto com os pendentes que voltam ao problema.
+        Janelas maiores que max_jobs_janela são divididas em lotes. Retorna a lista de decisões
+        (job_id, servidor_id, início, fim previstos), que inclui as decisões revistas de jobs pendentes.
+        """
+        decisoes = []
+        for i in range(0, len(jobs), self.max_jobs_janela):
+            decisoes.extend(self._resolver(jobs[i:i + self.max_jobs_janela], agora))
+        return decisoes
+
+    def executar(self, caminho, janela_ms=1000.0, duracao_max_s=None, do_inicio=True, ao_decidir=None):
+        """
+        Acompanha o arquivo JSONL de requisições e escalona as chegadas a cada janela_ms.
+        ao_decidir(decisoes) é chamado a cada janela; sem ele, um resumo é impresso.
+        """
+        leitor = LeitorJsonl(caminho, do_inicio)
+        inicio = time.monotonic()
+        num_janela = 0
+        while duracao_max_s is None or time.monotonic() - inicio < duracao_max_s:
+            proxima_janela = time.monotonic() + janela_ms / 1000
+            jobs = leitor.novos_jobs()
+            if jobs:
+                agora = (time.monotonic() - inicio) * 1000
+                comeco = time.perf_counter()
+                decisoes = self.escalonar(jobs, agora)
+                latencia = (time.perf_counter() - comeco) * 1000
+                if ao_decidir is not None:
+                    ao_decidir(decisoes)
+                else:
+                    fim = max(decisao[3] for decisao in decisoes)
+                    print(f"Janela {num_janela}: {len(jobs)} jobs, fim previsto = {fim:.1f} ms, latência = {latencia:.1f} ms")
+                num_janela += 1
+            time.sleep(max(0.0, proxima_janela - time.monotonic()))
+
+# Linha de comando
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Escalonamento online de jobs lidos de um arquivo JSONL.")
+    parser.add_argument('arquivo', help="arquivo JSON lines com um job por linha (campos de jobs.csv)")
+    parser.add_argument('--servidores', default='servers.csv')
+    parser.add_argument('--janela-ms', type=float, default=1000.0)
+    parser.add_argument('--orcamento-ms', type=float, default=50.0)
+    parser.add_argument('--duracao-s', type=float, default=None)
+    parser.add_argument('--semente', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    escalonador = EscalonadorOnline(carregar_servidores(args.servidores), orcamento_ms=args.orcamento_ms, semente=args.semente)
+    escalonador.executar(args.arquivo, args.janela_ms, args.duracao_s)
+
+if __name__ == "__main__":
+    main()